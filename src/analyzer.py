@@ -1,10 +1,13 @@
 """Repository analyzer module."""
 import os
-import ast
 import re
+import sys
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Set, Optional
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -12,23 +15,49 @@ logger = logging.getLogger(__name__)
 class FileMetadata:
     """Metadata for a single file."""
     
-    def __init__(self, path: Path, root: Path):
+    def __init__(self, path: Path, root: Path, size: Optional[int] = None):
+        """Initialize file metadata.
+        
+        Args:
+            path: Absolute path to the file
+            root: Repository root the relative path is computed against
+            size: File size if already known (e.g. from a scandir entry);
+                  stat'ed from path when omitted
+        """
         self.path = path
-        self.relative_path = path.relative_to(root)
         self.name = path.name
-        self.extension = path.suffix
-        self.size = path.stat().st_size if path.exists() else 0
+        # Few distinct extensions across many files: share one string object
+        self.extension = sys.intern(path.suffix)
+        # Derived strings cached once; reasoner passes read these repeatedly.
+        # Files found by the walk always sit under root, so the relative path
+        # is a plain string slice; the Path form is only built on demand.
+        path_str, root_str = str(path), str(root)
+        prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+        if path_str.startswith(prefix):
+            self.rel_path_str = path_str[len(prefix):]
+        else:
+            self.rel_path_str = str(path.relative_to(root))
+        self.parent_str = os.path.dirname(self.rel_path_str) or '.'
+        self.name_lower = self.name.lower()
+        if size is None:
+            size = path.stat().st_size if path.exists() else 0
+        self.size = size
         self.imports: List[str] = []
         self.is_executable = False
         self.has_main = False
         self.has_tests = False
         self.content_sample = ""
+    
+    @cached_property
+    def relative_path(self) -> Path:
+        """Path relative to the repository root (built on first access)."""
+        return Path(self.rel_path_str)
         
     def to_dict(self) -> Dict:
         """Convert metadata to dictionary."""
         return {
             "path": str(self.path),
-            "relative_path": str(self.relative_path),
+            "relative_path": self.rel_path_str,
             "name": self.name,
             "extension": self.extension,
             "size": self.size,
@@ -78,6 +107,27 @@ class RepositoryAnalyzer:
         '*.swp', '*.swo', '*~',
     }
     
+    # Line-anchored source scanners (bytes), used instead of a full ast.parse
+    # `from .pkg.mod import x` -> ('.', 'pkg.mod'); `import a, b as c` -> 'a, b as c'.
+    # Statements start a line or follow a `;`, so `import os; import sys` yields both.
+    IMPORT_RE = re.compile(
+        rb'(?:^|;)[ \t]*(?:from[ \t]+\.*([\w.]*)[ \t]+import\b|import[ \t]+([^\r\n#;\\]+))',
+        re.M,
+    )
+    # `if __name__ == '__main__':` (also elif / parenthesised / `in` comparisons)
+    MAIN_RE = re.compile(
+        rb'^[ \t]*(?:el)?if[ \t]*\(?[ \t]*__name__[ \t]*(?:[=!<>]|in\b|not\b|is\b)',
+        re.M,
+    )
+    # `def test_...` functions or `class Test...` classes
+    TEST_DEF_RE = re.compile(rb'^[ \t]*(?:def[ \t]+test_|class[ \t]+Test)', re.M)
+    IMPORT_NAME_RE = re.compile(rb'[\w.]+')
+    
+    # Per-file metadata extraction (read + regex scan) is I/O bound, so it is
+    # spread over a thread pool once a walk yields at least PARALLEL_MIN_FILES
+    MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+    PARALLEL_MIN_FILES = 64
+    
     def __init__(self, repo_path: str):
         """Initialize analyzer with repository path."""
         self.repo_path = Path(repo_path).resolve()
@@ -87,8 +137,49 @@ class RepositoryAnalyzer:
             raise ValueError(f"Repository path is not a directory: {repo_path}")
         
         self.files: List[FileMetadata] = []
+        self._dir_ignore_re, self._file_ignore_re = self._compile_ignore_patterns()
+        # Files in the same directory share their parent parts; decide those once
+        self._dir_parts_ignored = lru_cache(maxsize=4096)(self._check_dir_parts)
         logger.info(f"Initialized analyzer for: {self.repo_path}")
     
+    def _compile_ignore_patterns(self):
+        """Compile the ignore tables into two regexes, built once per analyzer.
+        
+        Directory parts are joined with NUL (which can't appear in a path
+        component) and matched in a single search:
+        - artifact: exact, case-sensitive part match
+        - contains: case-insensitive substring of a part (venv_new, my_venv, ...)
+        - wildcard: glob entries of IGNORE_DIRS, matched against a whole part
+        
+        File names are matched against all IGNORE_PATTERNS in one fullmatch.
+        
+        Returns:
+            Tuple of (directory-parts regex, file-name regex)
+        """
+        def glob_to_regex(pattern: str, any_char: str = '.') -> str:
+            if '*' not in pattern:
+                return re.escape(pattern)
+            return pattern.replace('.', r'\.').replace('*', any_char + '*')
+        
+        artifacts = '|'.join(re.escape(d) for d in sorted(self.ARTIFACT_DIRS))
+        contains = '|'.join(re.escape(d.lower()) for d in sorted(self.IGNORE_DIRS) if '*' not in d)
+        wildcards = '|'.join(glob_to_regex(d, r'[^\x00]') for d in sorted(self.IGNORE_DIRS) if '*' in d)
+        
+        dir_branches = [
+            rf'(?P<artifact>(?:^|\x00)(?:{artifacts})(?=\x00|\Z))',
+            rf'(?P<contains>(?i:{contains}))',
+        ]
+        if wildcards:
+            dir_branches.append(rf'(?P<wildcard>(?:^|\x00)(?:{wildcards})(?=\x00|\Z))')
+        dir_re = re.compile('|'.join(dir_branches))
+        
+        file_re = re.compile('(?:' + '|'.join(glob_to_regex(p) for p in sorted(self.IGNORE_PATTERNS)) + ')')
+        return dir_re, file_re
+    
+    def _check_dir_parts(self, parts: tuple) -> bool:
+        """Uncached directory-parts check (wrapped in an LRU cache per analyzer)."""
+        return self._dir_ignore_re.search('\x00'.join(parts)) is not None
+    
     def should_ignore(self, path: Path) -> bool:
         """Check if path should be ignored (path containment + artifact check)."""
         # Check all directory parts of the path
@@ -100,75 +191,106 @@ class RepositoryAnalyzer:
         
         if is_likely_file:
             # For files, check directory parts only (exclude filename)
-            parts_to_check = path.parts[:-1] if len(path.parts) > 1 else []
+            parts_to_check = path.parts[:-1]
         else:
             # For directories, check all parts including the directory name
             parts_to_check = path.parts
         
         # V2 ARTIFACT CHECK: Exact match on artifact directories (highest priority)
         # V2: If any path part is an exact artifact directory, exclude the entire subtree
-        # V2: This prevents analyzing .next/out/dist and their contents entirely
-        for part in parts_to_check:
-            if part in self.ARTIFACT_DIRS:
-                return True
-        
-        # PATH CONTAINMENT CHECK: Check if any directory part contains an ignored directory name
-        for part in parts_to_check:
-            part_lower = part.lower()
-            for ignored in self.IGNORE_DIRS:
-                if '*' in ignored:
-                    # Pattern matching for wildcard ignore dirs
-                    if self._match_pattern(part, ignored):
-                        return True
-                else:
-                    # Path containment: check if ignored string is in the directory part
-                    # This catches venv_new, my_venv, site-packages, etc.
-                    if ignored.lower() in part_lower:
-                        return True
+        # PATH CONTAINMENT CHECK: any directory part containing an ignored directory name
+        # (catches venv_new, my_venv, site-packages, etc.)
+        # Both checks run as one precompiled regex over the NUL-joined parts
+        if parts_to_check and self._dir_parts_ignored(parts_to_check):
+            return True
         
         # Check file patterns (only for likely files)
-        if is_likely_file:
-            for pattern in self.IGNORE_PATTERNS:
-                if self._match_pattern(path.name, pattern):
-                    return True
+        if is_likely_file and self._file_ignore_re.fullmatch(path.name):
+            return True
         
         return False
     
-    def _match_pattern(self, name: str, pattern: str) -> bool:
-        """Simple pattern matching for wildcards."""
-        if '*' not in pattern:
-            return name == pattern
-        
-        # Convert glob pattern to regex
-        regex_pattern = pattern.replace('.', r'\.').replace('*', '.*')
-        return bool(re.match(f'^{regex_pattern}$', name))
-    
     def analyze(self) -> List[FileMetadata]:
         """Recursively scan repository and collect metadata."""
         logger.info("Starting repository analysis...")
-        self.files = []
         
-        for root, dirs, files in os.walk(self.repo_path):
-            root_path = Path(root)
-            
-            # Filter out ignored directories in-place
-            dirs[:] = [d for d in dirs if not self.should_ignore(root_path / d)]
+        # Walk first (cheap, ordered), then extract metadata for all files
+        found = self._walk()
+        if len(found) >= self.PARALLEL_MIN_FILES and self.MAX_WORKERS > 1:
+            # executor.map yields results in submission order, so the file
+            # list is identical to a serial run
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                results = list(executor.map(self._build_metadata, found))
+        else:
+            results = [self._build_metadata(item) for item in found]
+        self.files = [metadata for metadata in results if metadata is not None]
+        
+        logger.info(f"Analysis complete. Found {len(self.files)} files.")
+        return self.files
+    
+    def _walk(self) -> List[tuple]:
+        """Collect (path, size) for every non-ignored file in walk order."""
+        found = []
+        
+        # Depth-first walk over os.scandir entries (same order as os.walk):
+        # DirEntry carries the file type and a cached stat, so files are
+        # never stat'ed again and ignored directories are never opened.
+        stack = [self.repo_path]
+        while stack:
+            dir_path = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError as e:
+                logger.debug(f"Cannot scan {dir_path}: {e}")
+                continue
             
-            for file in files:
-                file_path = root_path / file
+            subdirs = []
+            for entry in entries:
+                entry_path = dir_path / entry.name
                 
-                if self.should_ignore(file_path):
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                
+                if is_dir:
+                    # Prune ignored directories; like os.walk, don't follow symlinked dirs
+                    if not entry.is_symlink() and not self.should_ignore(entry_path):
+                        subdirs.append(entry_path)
+                    continue
+                
+                if self.should_ignore(entry_path):
                     continue
                 
                 try:
-                    metadata = FileMetadata(file_path, self.repo_path)
-                    self._collect_metadata(metadata)
-                    self.files.append(metadata)
-                except Exception as e:
-                    logger.warning(f"Failed to analyze {file_path}: {e}")
+                    size = entry.stat().st_size
+                except OSError:
+                    size = 0  # Broken symlink
+                found.append((entry_path, size))
+            
+            # Push in reverse so subdirectories are visited in listing order
+            stack.extend(reversed(subdirs))
         
-        logger.info(f"Analysis complete. Found {len(self.files)} files.")
-        return self.files
+        return found
+    
+    def _build_metadata(self, item: tuple) -> Optional[FileMetadata]:
+        """Build and fill metadata for one walked file (runs in worker threads).
+        
+        Args:
+            item: (absolute path, size) pair from _walk()
+            
+        Returns:
+            FileMetadata, or None if the file could not be analyzed
+        """
+        entry_path, size = item
+        try:
+            metadata = FileMetadata(entry_path, self.repo_path, size=size)
+            self._collect_metadata(metadata)
+            return metadata
+        except Exception as e:
+            logger.warning(f"Failed to analyze {entry_path}: {e}")
+            return None
     
     def _collect_metadata(self, metadata: FileMetadata):
         """Collect detailed metadata for a file."""
@@ -180,49 +302,41 @@ class RepositoryAnalyzer:
         self._check_patterns(metadata)
     
     def _analyze_python_file(self, metadata: FileMetadata):
-        """Analyze Python file for imports and structure."""
-        try:
-            with open(metadata.path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                metadata.content_sample = content[:500]  # First 500 chars
-            
-            # Parse AST to find imports
-            try:
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            metadata.imports.append(alias.name)
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            metadata.imports.append(node.module)
-                
-                # Check for if __name__ == '__main__'
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.If):
-                        if isinstance(node.test, ast.Compare):
-                            if (isinstance(node.test.left, ast.Name) and 
-                                node.test.left.id == '__name__'):
-                                metadata.has_main = True
-                                metadata.is_executable = True
-                                break
-                
-                # Check for test functions/classes
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        if node.name.startswith('test_'):
-                            metadata.has_tests = True
-                            break
-                    elif isinstance(node, ast.ClassDef):
-                        if node.name.startswith('Test'):
-                            metadata.has_tests = True
-                            break
-            
-            except SyntaxError:
-                logger.debug(f"Syntax error parsing {metadata.path}")
+        """Analyze Python file for imports and structure.
         
+        Scans the raw bytes with line-anchored regexes instead of building
+        an AST: only import statements, a __main__ guard and test
+        definitions are needed, and tokenizing + parsing every file
+        dominated analyze() on large repositories.
+        """
+        try:
+            data = metadata.path.read_bytes()
         except Exception as e:
             logger.debug(f"Failed to read {metadata.path}: {e}")
+            return
+        
+        # First 500 chars (a UTF-8 char is at most 4 bytes)
+        metadata.content_sample = data[:2000].decode('utf-8', errors='ignore')[:500]
+        
+        # Imports: `from X import ...` records X, `import a, b as c` records a and b
+        for from_module, import_list in self.IMPORT_RE.findall(data):
+            if import_list:
+                for item in import_list.split(b','):
+                    name = self.IMPORT_NAME_RE.match(item.strip())
+                    if name:
+                        metadata.imports.append(name.group().decode('ascii'))
+            elif from_module:
+                # Bare relative imports (`from . import x`) have no module name
+                metadata.imports.append(from_module.decode('ascii'))
+        
+        # Check for if __name__ == '__main__'
+        if self.MAIN_RE.search(data):
+            metadata.has_main = True
+            metadata.is_executable = True
+        
+        # Check for test functions/classes
+        if self.TEST_DEF_RE.search(data):
+            metadata.has_tests = True
     
     def _check_patterns(self, metadata: FileMetadata):
         """Check for common naming patterns."""
@@ -238,15 +352,12 @@ class RepositoryAnalyzer:
     
     def get_summary(self) -> Dict:
         """Get summary statistics."""
-        extensions = {}
-        for file in self.files:
-            ext = file.extension or 'no_extension'
-            extensions[ext] = extensions.get(ext, 0) + 1
+        extensions = Counter(f.extension or 'no_extension' for f in self.files)
         
         return {
             "total_files": len(self.files),
-            "extensions": extensions,
-            "python_files": sum(1 for f in self.files if f.extension == '.py'),
+            "extensions": dict(extensions),
+            "python_files": extensions['.py'],
             "executables": sum(1 for f in self.files if f.is_executable),
             "test_files": sum(1 for f in self.files if f.has_tests),
         }
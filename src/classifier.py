@@ -1,7 +1,9 @@
 """File classification engine using rule-based heuristics."""
+import re
+from collections import Counter, defaultdict
 from enum import Enum
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Set
 import logging
 
 from .analyzer import FileMetadata
@@ -68,10 +70,24 @@ class FileClassifier:
         'torch', 'tensorflow',
     }
     
-    TEST_IMPORT_PATTERNS = {
+    TEST_IMPORT_PATTERNS = frozenset({
         'pytest', 'unittest', 'mock', 'testify',
         'hypothesis', 'nose', 'doctest',
-    }
+    })
+    
+    # Non-Python extension -> category, built once in priority order:
+    # later updates win, so data beats config for shared extensions (.json)
+    EXTENSION_CATEGORIES = {ext: FileCategory.DOCS for ext in DOC_EXTENSIONS}
+    EXTENSION_CATEGORIES.update({ext: FileCategory.CONFIGS for ext in CONFIG_EXTENSIONS})
+    EXTENSION_CATEGORIES.update({ext: FileCategory.DATA for ext in DATA_EXTENSIONS})
+    
+    # Precompiled name/path rules for Python files (matched on lowercased strings).
+    # Keywords never contain a separator, so searching the whole relative path
+    # is the same as checking each path part (the file name included).
+    EXPERIMENT_PATH_RE = re.compile(r'experiment|playground|scratch|temp|tmp')
+    EXPERIMENT_NAME_RE = re.compile(r'^(?:demo_|example_|prototype_|untitled)|\.bak$')
+    CONFIG_NAME_RE = re.compile(r'(?:^|_)(?:config|settings)\.py$')
+    SCRIPT_PREFIXES = tuple(sorted(SCRIPT_KEYWORDS))
     
     def __init__(self):
         """Initialize classifier."""
@@ -79,11 +95,7 @@ class FileClassifier:
     
     def classify(self, metadata: FileMetadata) -> FileCategory:
         """Classify a file based on rules."""
-        # Markdown files
-        if metadata.extension == '.md':
-            return FileCategory.MARKDOWN
-        
-        # Non-Python files
+        # Non-Python files (markdown included)
         if metadata.extension != '.py':
             return self._classify_non_python(metadata)
         
@@ -94,32 +106,40 @@ class FileClassifier:
         self.classifications[str(metadata.path)] = category
         return category
     
-    def _classify_non_python(self, metadata: FileMetadata) -> FileCategory:
-        """Classify non-Python files."""
-        name_lower = metadata.name.lower()
-        
-        # Configuration files (before data files to catch config.json, etc.)
-        if metadata.name in self.CONFIG_PATTERNS:
-            return FileCategory.CONFIGS
-        
-        # Data files (check before general config extensions)
-        if metadata.extension in self.DATA_EXTENSIONS:
-            return FileCategory.DATA
+    def _extension_category(self, extension: str) -> FileCategory:
+        """Category implied by a non-Python file's extension alone."""
+        if extension == '.md':
+            return FileCategory.MARKDOWN
         
-        # Configuration extensions (after data check)
-        if metadata.extension in self.CONFIG_EXTENSIONS:
+        # Data, then config, then documentation extensions (one table lookup)
+        return self.EXTENSION_CATEGORIES.get(extension, FileCategory.UNKNOWN)
+    
+    def _classify_non_python(self, metadata: FileMetadata,
+                             extension_category: Optional[FileCategory] = None) -> FileCategory:
+        """Classify non-Python files.
+        
+        Args:
+            metadata: File to classify
+            extension_category: Precomputed _extension_category() result for
+                the file's extension, when the caller already has it
+            
+        Returns:
+            The file's category
+        """
+        if extension_category is None:
+            extension_category = self._extension_category(metadata.extension)
+        
+        # Markdown stays markdown; otherwise exact config file names win over
+        # the extension (catches config.json, docker-compose.yml, etc.)
+        if extension_category is not FileCategory.MARKDOWN and metadata.name in self.CONFIG_PATTERNS:
             return FileCategory.CONFIGS
         
-        # Documentation
-        if metadata.extension in self.DOC_EXTENSIONS:
-            return FileCategory.DOCS
-        
-        return FileCategory.UNKNOWN
+        return extension_category
     
     def _classify_python(self, metadata: FileMetadata) -> FileCategory:
         """Classify Python files using heuristics."""
         name_lower = metadata.name.lower()
-        path_lower = str(metadata.relative_path).lower()
+        path_lower = metadata.rel_path_str.lower()
         
         # Rule 1: Experimental/temporary files (check before tests to avoid misclassification)
         if self._is_experiment_file(metadata, name_lower, path_lower):
@@ -146,39 +166,25 @@ class FileClassifier:
     
     def _is_test_file(self, metadata: FileMetadata, name_lower: str, path_lower: str) -> bool:
         """Check if file is a test file."""
-        # Path contains 'test' or 'tests' directory (highest priority for path-based)
-        path_parts = [p.lower() for p in metadata.relative_path.parts]
-        if any('test' in part for part in path_parts):
+        # Any path part (directory or file name) containing 'test'; this also
+        # covers the test_*.py and *_test.py name patterns
+        if 'test' in path_lower:
             return True
         
         # Has test functions/classes
         if metadata.has_tests:
             return True
         
-        # Name patterns
-        if name_lower.startswith('test_'):
-            return True
-        if name_lower.endswith('_test.py'):
-            return True
-        
         # Imports test frameworks
-        if any(imp in self.TEST_IMPORT_PATTERNS for imp in metadata.imports):
-            return True
-        
-        return False
+        return not self.TEST_IMPORT_PATTERNS.isdisjoint(metadata.imports)
     
     def _is_config_file(self, metadata: FileMetadata, name_lower: str) -> bool:
         """Check if file is a configuration file."""
         if metadata.name in self.CONFIG_PATTERNS:
             return True
         
-        if name_lower.endswith('_config.py') or name_lower == 'config.py':
-            return True
-        
-        if name_lower == 'settings.py' or name_lower.endswith('_settings.py'):
-            return True
-        
-        return False
+        # config.py, settings.py, *_config.py, *_settings.py
+        return self.CONFIG_NAME_RE.search(name_lower) is not None
     
     def _is_script_file(self, metadata: FileMetadata, name_lower: str, path_lower: str) -> bool:
         """Check if file is an executable script."""
@@ -187,43 +193,25 @@ class FileClassifier:
             return True
         
         # Name starts with script keywords
-        if any(name_lower.startswith(kw) for kw in self.SCRIPT_KEYWORDS):
+        if name_lower.startswith(self.SCRIPT_PREFIXES):
             return True
         
         # In scripts directory
-        if 'scripts' in path_lower.split(os.sep):
-            return True
-        
-        return False
+        return 'scripts' in path_lower.split(os.sep)
     
     def _is_experiment_file(self, metadata: FileMetadata, name_lower: str, path_lower: str) -> bool:
         """Check if file is experimental/temporary."""
-        # Specific keyword patterns (use more precise matching)
-        experiment_prefixes = ['temp_', 'tmp_', 'demo_', 'example_', 'prototype_']
-        experiment_names = ['experiment', 'playground', 'scratch', 'test_run']
-        
-        # Check for prefixes
-        if any(name_lower.startswith(prefix) for prefix in experiment_prefixes):
+        # experiment/playground/scratch/temp/tmp anywhere in the path or name
+        # (covers the temp_/tmp_ prefixes too)
+        if self.EXPERIMENT_PATH_RE.search(path_lower):
             return True
         
-        # Check for exact matches or as whole words
-        if any(keyword == name_lower.replace('.py', '') for keyword in experiment_names):
+        # demo_/example_/prototype_ prefixes, untitled or backup patterns
+        if self.EXPERIMENT_NAME_RE.search(name_lower):
             return True
         
-        # Check if experiment/playground/scratch appears in the name
-        if any(kw in name_lower for kw in ['experiment', 'playground', 'scratch']):
-            return True
-        
-        # Path patterns
-        path_parts = [p.lower() for p in metadata.relative_path.parts]
-        if any(kw in part for part in path_parts for kw in ['experiment', 'playground', 'scratch', 'temp', 'tmp']):
-            return True
-        
-        # Untitled or backup patterns
-        if name_lower.startswith('untitled') or name_lower.endswith('.bak'):
-            return True
-        
-        return False
+        # Exact match as whole name (experiment/playground/scratch are covered above)
+        return name_lower.replace('.py', '') == 'test_run'
     
     def _is_source_file(self, metadata: FileMetadata, path_lower: str) -> bool:
         """Check if file is application source code."""
@@ -232,7 +220,7 @@ class FileClassifier:
             return True
         
         # Has __init__.py nearby (package structure)
-        if metadata.relative_path.parts and len(metadata.relative_path.parts) > 1:
+        if os.sep in metadata.rel_path_str:
             parent = metadata.path.parent
             if (parent / '__init__.py').exists():
                 return True
@@ -249,21 +237,34 @@ class FileClassifier:
         return False
     
     def classify_all(self, files: List[FileMetadata]) -> dict:
-        """Classify all files and return summary."""
-        results = {}
-        category_counts = {cat: 0 for cat in FileCategory}
-        
-        for file in files:
-            category = self.classify(file)
-            results[str(file.relative_path)] = category
-            category_counts[category] += 1
+        """Classify all files and return summary.
+        
+        Files are bucketed by extension first so each non-Python bucket
+        resolves its extension category once; only Python files run the full
+        classify() rule ladder. Results keep the input order.
+        """
+        buckets = defaultdict(list)
+        for index, file in enumerate(files):
+            buckets[file.extension].append(index)
+        
+        categories = [None] * len(files)
+        for extension, indices in buckets.items():
+            if extension == '.py':
+                for index in indices:
+                    categories[index] = self.classify(files[index])
+            else:
+                extension_category = self._extension_category(extension)
+                for index in indices:
+                    categories[index] = self._classify_non_python(files[index], extension_category)
+        
+        results = {file.rel_path_str: category for file, category in zip(files, categories)}
+        category_counts = Counter(categories)
         
         logger.info(f"Classified {len(files)} files")
-        for category, count in category_counts.items():
-            if count > 0:
-                logger.info(f"  {category.value}: {count}")
+        for category in FileCategory:
+            if category_counts[category] > 0:
+                logger.info(f"  {category.value}: {category_counts[category]}")
         
         return results
 
-
 import os  # Add missing import
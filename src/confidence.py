@@ -3,7 +3,9 @@
 V2.4: Provides a single HIGH/MEDIUM/LOW verdict with explainable reasons.
 Read-only advisory - no execution blocking.
 """
+from collections import Counter
 from enum import Enum
+from functools import total_ordering
 from typing import List, Tuple
 from pathlib import Path
 
@@ -11,16 +13,35 @@ from .proposal import Proposal, ActionType, RiskLevel
 from .repo_type import RepoType
 
 
+@total_ordering
 class ConfidenceLevel(Enum):
-    """Overall confidence level for reorganization."""
+    """Overall confidence level for reorganization.
+    
+    Values stay the display strings; levels compare by rank
+    (LOW < MEDIUM < HIGH) so callers can use < / >= directly.
+    """
     HIGH = "HIGH"
     MEDIUM = "MEDIUM"
     LOW = "LOW"
+    
+    def __lt__(self, other):
+        if not isinstance(other, ConfidenceLevel):
+            return NotImplemented
+        return _CONFIDENCE_RANK[self] < _CONFIDENCE_RANK[other]
+
+
+_CONFIDENCE_RANK = {ConfidenceLevel.LOW: 0, ConfidenceLevel.MEDIUM: 1, ConfidenceLevel.HIGH: 2}
 
 
 class ConfidenceScore:
     """Calculates and explains reorganization confidence."""
     
+    # Everything is derived once in __init__; no per-instance dict needed
+    __slots__ = ('proposals', 'repo_type', 'has_tests', 'import_warnings_count',
+                 'is_dry_run', 'move_proposals', 'move_count', 'high_risk_count',
+                 'medium_risk_count', 'low_risk_count', 'confidence_level',
+                 'positive_factors', 'risk_factors', '_text')
+    
     def __init__(self, proposals: List[Proposal], repo_type: RepoType = None, 
                  has_tests: bool = False, import_warnings_count: int = 0,
                  is_dry_run: bool = True):
@@ -39,15 +60,18 @@ class ConfidenceScore:
         self.import_warnings_count = import_warnings_count
         self.is_dry_run = is_dry_run
         
-        # Extract move proposals and risk breakdown
+        # Extract move proposals and risk breakdown (single pass)
         self.move_proposals = [p for p in proposals if p.action == ActionType.MOVE]
-        self.high_risk_moves = [p for p in self.move_proposals if p.risk_level == RiskLevel.HIGH]
-        self.medium_risk_moves = [p for p in self.move_proposals if p.risk_level == RiskLevel.MEDIUM]
-        self.low_risk_moves = [p for p in self.move_proposals if p.risk_level == RiskLevel.LOW]
+        risk_counts = Counter(p.risk_level for p in self.move_proposals)
+        self.move_count = len(self.move_proposals)
+        self.high_risk_count = risk_counts[RiskLevel.HIGH]
+        self.medium_risk_count = risk_counts[RiskLevel.MEDIUM]
+        self.low_risk_count = risk_counts[RiskLevel.LOW]
         
         # Calculate confidence
         self.confidence_level = self._calculate_confidence()
         self.positive_factors, self.risk_factors = self._collect_factors()
+        self._text = None  # Rendered lazily by to_text()
     
     def _calculate_confidence(self) -> ConfidenceLevel:
         """Calculate confidence level using simple thresholds.
@@ -63,13 +87,13 @@ class ConfidenceScore:
             score -= 30
         
         # Penalty for high-risk moves
-        if len(self.high_risk_moves) > 0:
-            score -= 20 * min(len(self.high_risk_moves), 3)  # Cap at 60 penalty
+        if self.high_risk_count > 0:
+            score -= 20 * min(self.high_risk_count, 3)  # Cap at 60 penalty
         
         # Penalty for medium-risk moves
-        if len(self.medium_risk_moves) > 5:
+        if self.medium_risk_count > 5:
             score -= 15
-        elif len(self.medium_risk_moves) > 10:
+        elif self.medium_risk_count > 10:
             score -= 25
         
         # Penalty for import breakage warnings
@@ -77,7 +101,7 @@ class ConfidenceScore:
             score -= 10 * min(self.import_warnings_count, 3)  # Cap at 30 penalty
         
         # Penalty for no tests (harder to validate changes)
-        if not self.has_tests and len(self.move_proposals) > 0:
+        if not self.has_tests and self.move_count > 0:
             score -= 10
         
         # Bonus for dry-run mode (safer)
@@ -85,7 +109,7 @@ class ConfidenceScore:
             score += 5
         
         # Penalty for too many changes at once
-        if len(self.move_proposals) > 20:
+        if self.move_count > 20:
             score -= 15
         
         # Convert score to confidence level
@@ -117,11 +141,11 @@ class ConfidenceScore:
         # Test presence
         if self.has_tests:
             positives.append("Tests detected (easier to validate changes)")
-        elif len(self.move_proposals) > 0:
+        elif self.move_count > 0:
             risks.append("No tests detected (harder to validate)")
         
         # Move proposal count
-        move_count = len(self.move_proposals)
+        move_count = self.move_count
         if move_count == 0:
             positives.append("No structural changes proposed")
         elif move_count <= 5:
@@ -132,14 +156,14 @@ class ConfidenceScore:
             risks.append(f"Large number of changes ({move_count} moves)")
         
         # Risk level breakdown
-        if len(self.high_risk_moves) > 0:
-            risks.append(f"{len(self.high_risk_moves)} high-risk moves")
+        if self.high_risk_count > 0:
+            risks.append(f"{self.high_risk_count} high-risk moves")
         
-        if len(self.medium_risk_moves) > 0:
-            risks.append(f"{len(self.medium_risk_moves)} medium-risk moves")
+        if self.medium_risk_count > 0:
+            risks.append(f"{self.medium_risk_count} medium-risk moves")
         
-        if len(self.low_risk_moves) > 0 and len(self.high_risk_moves) == 0 and len(self.medium_risk_moves) == 0:
-            positives.append(f"All moves are low-risk ({len(self.low_risk_moves)} moves)")
+        if self.low_risk_count > 0 and self.high_risk_count == 0 and self.medium_risk_count == 0:
+            positives.append(f"All moves are low-risk ({self.low_risk_count} moves)")
         
         # Import warnings
         if self.import_warnings_count > 0:
@@ -156,9 +180,14 @@ class ConfidenceScore:
     def to_text(self) -> str:
         """Render confidence score as formatted text.
         
+        Rendered once and cached: the score is fixed after __init__.
+        
         Returns:
             Formatted confidence score with verdict and reasons
         """
+        if self._text is not None:
+            return self._text
+        
         lines = []
         lines.append("=" * 60)
         lines.append(f"📊 REORGANIZATION CONFIDENCE: {self.confidence_level.value}")
@@ -189,7 +218,8 @@ class ConfidenceScore:
         
         lines.append("=" * 60)
         
-        return "\n".join(lines)
+        self._text = "\n".join(lines)
+        return self._text
     
     def get_summary(self) -> dict:
         """Get confidence summary as dictionary.
@@ -201,10 +231,10 @@ class ConfidenceScore:
             "confidence_level": self.confidence_level.value,
             "positive_factors": self.positive_factors,
             "risk_factors": self.risk_factors,
-            "move_count": len(self.move_proposals),
-            "high_risk_count": len(self.high_risk_moves),
-            "medium_risk_count": len(self.medium_risk_moves),
-            "low_risk_count": len(self.low_risk_moves),
+            "move_count": self.move_count,
+            "high_risk_count": self.high_risk_count,
+            "medium_risk_count": self.medium_risk_count,
+            "low_risk_count": self.low_risk_count,
             "import_warnings_count": self.import_warnings_count,
             "has_tests": self.has_tests,
             "is_dry_run": self.is_dry_run
@@ -4,8 +4,9 @@ V2: Static, hardcoded profiles that define behavior based on repository type.
 V2: No configuration files or CLI flags - automatic selection only.
 V2: Suppresses expected framework duplicates to reduce noise in frontend repositories.
 """
-from dataclasses import dataclass
-from typing import Set
+import re
+from dataclasses import dataclass, field
+from typing import Optional, Pattern, Set
 from .repo_type import RepoType
 
 
@@ -15,6 +16,16 @@ class EcosystemProfile:
     name: str
     ignored_duplicate_patterns: Set[str]
     risk_adjustments: dict
+    _suppress_re: Optional[Pattern] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Compile the substring patterns once into a single alternation
+        if self.ignored_duplicate_patterns:
+            self._suppress_re = re.compile("|".join(
+                re.escape(p.lower()) for p in sorted(self.ignored_duplicate_patterns)
+            ))
+        else:
+            self._suppress_re = None
     
     def should_suppress_duplicate(self, filename: str) -> bool:
         """V2: Check if duplicate should be suppressed for this filename.
@@ -22,11 +33,9 @@ class EcosystemProfile:
         Used to filter out valid framework patterns like multiple index.html files
         in multi-page Next.js sites, which are expected and not errors.
         """
-        filename_lower = filename.lower()
-        for pattern in self.ignored_duplicate_patterns:
-            if pattern in filename_lower:
-                return True
-        return False
+        if self._suppress_re is None:
+            return False
+        return self._suppress_re.search(filename.lower()) is not None
 
 
 # V2: Python ecosystem profile - no duplicate suppressions
@@ -63,13 +72,17 @@ FRONTEND_STATIC_PROFILE = EcosystemProfile(
 )
 
 
+# V2: Profile selection table - MIXED repos get the conservative frontend profile
+_PROFILE_BY_REPO_TYPE = {
+    RepoType.PYTHON_DOMINANT: PYTHON_PROFILE,
+    RepoType.NON_PYTHON: NEXTJS_PROFILE,  # For non-Python, assume frontend
+    RepoType.MIXED: NEXTJS_PROFILE,
+}
+
+
 def get_profile_for_repo_type(repo_type: RepoType) -> EcosystemProfile:
-    """Select appropriate ecosystem profile based on repository type."""
-    if repo_type == RepoType.PYTHON_DOMINANT:
-        return PYTHON_PROFILE
-    elif repo_type == RepoType.NON_PYTHON:
-        # For non-Python, assume frontend
-        return NEXTJS_PROFILE
-    else:  # MIXED
-        # For mixed repos, use conservative frontend profile
-        return NEXTJS_PROFILE
+    """Select appropriate ecosystem profile based on repository type.
+    
+    Profiles are module-level singletons, so repeated calls share them.
+    """
+    return _PROFILE_BY_REPO_TYPE.get(repo_type, NEXTJS_PROFILE)
@@ -2,39 +2,95 @@
 
 V2.1: Human-in-the-loop execution layer with interactive approval.
 """
+import errno
+import os
 import shutil
+import stat
 import logging
+import time
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 import json
 
+try:
+    import orjson  # Optional: faster (de)serialization of the history log
+except ImportError:
+    orjson = None
+
 from .proposal import Proposal, ActionType, RiskLevel
 
 logger = logging.getLogger(__name__)
 
 
+def _dump_history(history: List[Dict]) -> bytes:
+    """Serialize history entries to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(history, option=orjson.OPT_INDENT_2)
+    return json.dumps(history, indent=2).encode('utf-8')
+
+
+def _move_file(source: str, target: str) -> None:
+    """Move a file with a single rename, copying only across filesystems.
+    
+    Moves stay inside one repository, so os.replace (one atomic rename)
+    nearly always succeeds; shutil.move's copy + unlink is the EXDEV fallback.
+    """
+    try:
+        os.replace(source, target)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(source, target)
+
+
+def _ensure_dir(directory: str) -> None:
+    """Create directory (and parents) if missing, logging only real creations."""
+    try:
+        os.makedirs(directory)
+    except FileExistsError:
+        return
+    logger.info(f"Created directory: {directory}")
+
+
+def _load_history_bytes(data: bytes) -> List[Dict]:
+    """Parse history JSON bytes (as written by _dump_history)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class ExecutionResult:
     """Result of executing a single proposal."""
     
+    __slots__ = ('proposal', 'success', 'message', 'skipped', 'created')
+    
     def __init__(self, proposal: Proposal, success: bool, message: str, skipped: bool = False):
         self.proposal = proposal
         self.success = success
         self.message = message
         self.skipped = skipped
-        self.timestamp = datetime.now().isoformat()
+        # Epoch seconds; the ISO string is only built when a result is logged
+        self.created = time.time()
+    
+    @property
+    def timestamp(self) -> str:
+        """Local ISO-8601 time the result was created."""
+        return datetime.fromtimestamp(self.created).isoformat()
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for logging."""
+        proposal = self.proposal
+        target = proposal.target_path
         return {
             'timestamp': self.timestamp,
-            'action': self.proposal.action.value,
-            'source': str(self.proposal.source_path),
-            'target': str(self.proposal.target_path) if self.proposal.target_path else None,
+            'action': proposal.action.value,
+            'source': str(proposal.source_path),
+            'target': str(target) if target else None,
             'success': self.success,
             'skipped': self.skipped,
             'message': self.message,
-            'risk': self.proposal.risk_level.value,
+            'risk': proposal.risk_level.value,
         }
 
 
@@ -59,7 +115,20 @@ class ProposalExecutor:
         self.repo_path = Path(repo_path).resolve()
         self.dry_run = dry_run
         self.results: List[ExecutionResult] = []
+        # How many leading entries of results are already in the history log
+        self._logged = 0
+        # Outcome counts kept in step with results, so summaries never rescan
+        self._n_success = 0
+        self._n_failed = 0
+        self._n_skipped = 0
         self.log_file = self.repo_path / '.repo-tool-history.json'
+        # String root for per-proposal path joins (os.path is cheaper than pathlib)
+        self._root = str(self.repo_path)
+        # Last parsed history and the (inode, mtime_ns, size) it was read/written at
+        self._history_cache: Optional[List[Dict]] = None
+        self._history_key: Optional[tuple] = None
+        # Target directories already ensured during the current execute_batch()
+        self._batch_dirs: Optional[set] = None
         
         logger.info(f"Executor initialized (dry_run={dry_run})")
     
@@ -80,7 +149,7 @@ class ProposalExecutor:
                 message=f"Unsupported action: {proposal.action.value} (only MOVE supported in V2.1)",
                 skipped=True
             )
-            self.results.append(result)
+            self._record(result)
             return result
         
         # Validate the move operation
@@ -91,7 +160,7 @@ class ProposalExecutor:
                 success=False,
                 message=f"Validation failed: {validation_error}"
             )
-            self.results.append(result)
+            self._record(result)
             return result
         
         # Execute the move
@@ -105,16 +174,50 @@ class ProposalExecutor:
                 logger.info(message)
                 result = ExecutionResult(proposal=proposal, success=True, message=message)
             
-            self.results.append(result)
+            self._record(result)
             return result
             
         except Exception as e:
             error_msg = f"Failed to execute: {str(e)}"
             logger.error(error_msg)
             result = ExecutionResult(proposal=proposal, success=False, message=error_msg)
-            self.results.append(result)
+            self._record(result)
             return result
     
+    def _record(self, result: ExecutionResult):
+        """Append a result and bump its outcome counter."""
+        self.results.append(result)
+        if result.success:
+            self._n_success += 1
+        elif result.skipped:
+            self._n_skipped += 1
+        else:
+            self._n_failed += 1
+    
+    def execute_batch(self, proposals: List[Proposal]) -> List[ExecutionResult]:
+        """Execute proposals in order, then log the batch with one history write.
+        
+        The write also flushes any earlier results not yet logged, and marks
+        them all as saved so a later save_history() does not repeat them.
+        Each distinct target directory is created at most once per batch.
+        
+        Args:
+            proposals: The proposals to execute
+        
+        Returns:
+            One ExecutionResult per proposal, in input order
+        """
+        self._batch_dirs = set()
+        try:
+            results = [self.execute_proposal(proposal) for proposal in proposals]
+        finally:
+            self._batch_dirs = None
+        
+        if not self.dry_run and any(r.success for r in results):
+            self.save_history()
+        
+        return results
+    
     def _validate_move(self, proposal: Proposal) -> Optional[str]:
         """Validate a MOVE proposal before execution.
         
@@ -127,28 +230,38 @@ class ProposalExecutor:
         if not proposal.target_path:
             return "Target path is None"
         
-        source_full = self.repo_path / proposal.source_path
-        target_full = self.repo_path / proposal.target_path
+        source_full, target_full = self._full_paths(proposal)
         
-        # Check source exists
-        if not source_full.exists():
+        # Check source exists and is a file (not directory), from one stat
+        try:
+            source_mode = os.stat(source_full).st_mode
+        except OSError:
             return f"Source file does not exist: {source_full}"
         
-        # Check source is a file (not directory)
-        if not source_full.is_file():
+        if not stat.S_ISREG(source_mode):
             return f"Source is not a file: {source_full}"
         
         # Check target doesn't already exist (conflict)
-        if target_full.exists():
+        if os.path.exists(target_full):
             return f"Target already exists (conflict): {target_full}"
         
-        # Check target directory is valid
-        target_dir = target_full.parent
-        if target_dir.exists() and not target_dir.is_dir():
+        # Check target directory is valid (a missing parent is created later)
+        target_dir = os.path.dirname(target_full)
+        try:
+            parent_mode = os.stat(target_dir).st_mode
+        except OSError:
+            return None
+        
+        if not stat.S_ISDIR(parent_mode):
             return f"Target parent exists but is not a directory: {target_dir}"
         
         return None
     
+    def _full_paths(self, proposal: Proposal) -> Tuple[str, str]:
+        """Absolute source and target paths of a proposal, as plain strings."""
+        return (os.path.join(self._root, proposal.source_path),
+                os.path.join(self._root, proposal.target_path))
+    
     def _execute_move(self, proposal: Proposal) -> str:
         """Execute a MOVE operation (real filesystem change).
         
@@ -158,57 +271,94 @@ class ProposalExecutor:
         Raises:
             Exception if move fails
         """
-        source_full = self.repo_path / proposal.source_path
-        target_full = self.repo_path / proposal.target_path
+        source_full, target_full = self._full_paths(proposal)
         
-        # Create target directory if needed
-        target_dir = target_full.parent
-        if not target_dir.exists():
-            target_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Created directory: {target_dir}")
+        # Create target directory if needed (once per directory within a batch)
+        target_dir = os.path.dirname(target_full)
+        if self._batch_dirs is None:
+            _ensure_dir(target_dir)
+        elif target_dir not in self._batch_dirs:
+            _ensure_dir(target_dir)
+            self._batch_dirs.add(target_dir)
         
         # Move the file
-        shutil.move(str(source_full), str(target_full))
+        _move_file(source_full, target_full)
         
         return f"Moved {proposal.source_path} -> {proposal.target_path}"
     
     def save_history(self):
-        """Save execution history to log file for audit trail."""
-        if not self.results:
+        """Save execution history to log file for audit trail.
+        
+        Only results not yet written by an earlier save are appended, so
+        saving twice never logs (and later rolls back) a move twice.
+        """
+        results = self.results[self._logged:]
+        if not results:
             return
         
         # Load existing history
         history = []
-        if self.log_file.exists():
-            try:
-                with open(self.log_file, 'r') as f:
-                    history = json.load(f)
-            except Exception as e:
-                logger.warning(f"Could not load existing history: {e}")
+        try:
+            history = self._read_history() or []
+        except Exception as e:
+            logger.warning(f"Could not load existing history: {e}")
         
         # Append current results
-        history.extend([r.to_dict() for r in self.results])
+        history.extend([r.to_dict() for r in results])
         
         # Save
         try:
-            with open(self.log_file, 'w') as f:
-                json.dump(history, f, indent=2)
+            # Serialize in memory and write once (json.dump writes per chunk)
+            self._write_history(history)
+            self._logged += len(results)
             logger.info(f"Saved execution history to {self.log_file}")
         except Exception as e:
             logger.error(f"Failed to save history: {e}")
     
+    def _read_history(self, use_cache: bool = True) -> Optional[List[Dict]]:
+        """Load the history log, reusing the last parse while the file is unchanged.
+        
+        The file is only re-read when its (inode, mtime_ns, size) differs from
+        the last read or write by this executor. An outside rewrite of the same
+        size within one mtime tick is not detected, so callers that act on the
+        entries (rollback) pass use_cache=False.
+        
+        Args:
+            use_cache: If False, always re-read and re-parse the file
+        
+        Returns:
+            A fresh list of history entries, or None if there is no log file
+        
+        Raises:
+            OSError or ValueError if the file cannot be read or parsed
+        """
+        try:
+            st = self.log_file.stat()
+        except FileNotFoundError:
+            return None
+        
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if not use_cache or self._history_cache is None or self._history_key != key:
+            self._history_cache = _load_history_bytes(self.log_file.read_bytes())
+            self._history_key = key
+        
+        # Callers append to the list; keep the cached copy untouched
+        return list(self._history_cache)
+    
+    def _write_history(self, history: List[Dict]):
+        """Write the full history log in one call and remember it as the cache."""
+        self.log_file.write_bytes(_dump_history(history))
+        st = self.log_file.stat()
+        self._history_cache = list(history)
+        self._history_key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    
     def get_summary(self) -> Dict:
         """Get summary of execution results."""
-        total = len(self.results)
-        successful = sum(1 for r in self.results if r.success)
-        failed = sum(1 for r in self.results if not r.success and not r.skipped)
-        skipped = sum(1 for r in self.results if r.skipped)
-        
         return {
-            'total': total,
-            'successful': successful,
-            'failed': failed,
-            'skipped': skipped,
+            'total': len(self.results),
+            'successful': self._n_success,
+            'failed': self._n_failed,
+            'skipped': self._n_skipped,
             'dry_run': self.dry_run,
         }
     
@@ -230,18 +380,18 @@ class ProposalExecutor:
         - Fails fast on first validation error
         - Logs all rollback operations to history
         """
-        # Read history file
-        if not self.log_file.exists():
-            logger.warning(f"No history file found: {self.log_file}")
-            return []
-        
+        # Read history file (always from disk: undoing moves from a stale
+        # cached copy could move the wrong files)
         try:
-            with open(self.log_file, 'r') as f:
-                history = json.load(f)
+            history = self._read_history(use_cache=False)
         except Exception as e:
             logger.error(f"Failed to read history: {e}")
             return []
         
+        if history is None:
+            logger.warning(f"No history file found: {self.log_file}")
+            return []
+        
         # Filter for successful MOVE operations
         moves = [
             entry for entry in history
@@ -272,11 +422,11 @@ class ProposalExecutor:
             rollback_target = original_source
             
             # Validate rollback operation
-            source_full = self.repo_path / rollback_source
-            target_full = self.repo_path / rollback_target
+            source_full = os.path.join(self._root, rollback_source)
+            target_full = os.path.join(self._root, rollback_target)
             
             # Safety check: target (original location) must exist
-            if not source_full.exists():
+            if not os.path.exists(source_full):
                 error_msg = f"Rollback validation failed: Target file does not exist: {source_full}"
                 logger.error(error_msg)
                 result = ExecutionResult(
@@ -295,7 +445,7 @@ class ProposalExecutor:
                 break
             
             # Safety check: source (original location) must NOT exist
-            if target_full.exists():
+            if os.path.exists(target_full):
                 error_msg = f"Rollback validation failed: Source location already exists (conflict): {target_full}"
                 logger.error(error_msg)
                 result = ExecutionResult(
@@ -331,13 +481,10 @@ class ProposalExecutor:
                     )
                 else:
                     # Create target directory if needed
-                    target_dir = target_full.parent
-                    if not target_dir.exists():
-                        target_dir.mkdir(parents=True, exist_ok=True)
-                        logger.info(f"Created directory: {target_dir}")
+                    _ensure_dir(os.path.dirname(target_full))
                     
                     # Move the file back
-                    shutil.move(str(source_full), str(target_full))
+                    _move_file(source_full, target_full)
                     message = f"Rolled back {rollback_source} -> {rollback_target}"
                     logger.info(message)
                     
@@ -386,12 +533,10 @@ class ProposalExecutor:
         
         # Load existing history
         history = []
-        if self.log_file.exists():
-            try:
-                with open(self.log_file, 'r') as f:
-                    history = json.load(f)
-            except Exception as e:
-                logger.warning(f"Could not load existing history: {e}")
+        try:
+            history = self._read_history() or []
+        except Exception as e:
+            logger.warning(f"Could not load existing history: {e}")
         
         # Append rollback results with ROLLBACK action marker
         for result in rollback_results:
@@ -401,8 +546,8 @@ class ProposalExecutor:
         
         # Save
         try:
-            with open(self.log_file, 'w') as f:
-                json.dump(history, f, indent=2)
+            # Serialize in memory and write once (json.dump writes per chunk)
+            self._write_history(history)
             logger.info(f"Saved rollback history to {self.log_file}")
         except Exception as e:
             logger.error(f"Failed to save rollback history: {e}")
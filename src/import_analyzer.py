@@ -4,6 +4,8 @@ Preflight warnings for MOVE proposals that may break imports.
 Read-only analysis - no code modification or auto-fixing.
 """
 import ast
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import List, Dict, Set, Tuple, Optional
 import logging
@@ -33,6 +35,11 @@ class ImportStatement:
         self.names = names
     
     def __repr__(self):
+        return self._repr
+    
+    @cached_property
+    def _repr(self) -> str:
+        """Source-like rendering, built on first use (only warnings need it)."""
         if self.is_relative:
             dots = '.' * self.level
             if self.module:
@@ -81,6 +88,9 @@ class ImportAnalyzer:
     Advisory-only warnings. No code modification. Python-only.
     """
     
+    # Threads used to prefetch source files in analyze_proposals
+    READ_WORKERS = 8
+    
     def __init__(self, repo_path: Path):
         """Initialize import analyzer.
         
@@ -99,19 +109,43 @@ class ImportAnalyzer:
         Returns:
             List of ImportStatement objects
         """
+        data = self._read_source(file_path)
+        if data is None:
+            return []
+        
+        return self.extract_imports_from_bytes(file_path, data)
+    
+    def _read_source(self, file_path: Path) -> Optional[bytes]:
+        """Read raw source bytes for a Python file.
+        
+        Safe to call from worker threads (no shared state is touched).
+        
+        Returns:
+            File contents, or None if the file is missing, not Python, or unreadable
+        """
         full_path = self.repo_path / file_path
         
-        if not full_path.exists() or not full_path.is_file():
-            return []
+        if full_path.suffix != '.py' or not full_path.is_file():
+            return None
         
-        if full_path.suffix != '.py':
-            return []
+        try:
+            return full_path.read_bytes()
+        except OSError as e:
+            logger.debug(f"Error reading {file_path}: {e}")
+            return None
+    
+    def extract_imports_from_bytes(self, file_path: Path, data: bytes) -> List[ImportStatement]:
+        """Extract import statements from already-read source bytes.
+        
+        Args:
+            file_path: Path used in diagnostics (relative to repo root)
+            data: Raw file contents
         
+        Returns:
+            List of ImportStatement objects (empty on parse errors)
+        """
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            tree = ast.parse(content, filename=str(file_path))
+            tree = ast.parse(data, filename=str(file_path))
             imports = []
             
             for node in ast.walk(tree):
@@ -154,6 +188,10 @@ class ImportAnalyzer:
     def analyze_proposals(self, proposals: List[Proposal]) -> List[ImportWarning]:
         """Analyze MOVE proposals for potential import breakage.
         
+        Source files are read on a small thread pool while the main thread
+        parses them, so disk latency overlaps with AST work. Results are
+        consumed in proposal order to keep warning output deterministic.
+        
         Args:
             proposals: List of proposals to analyze
         
@@ -173,22 +211,29 @@ class ImportAnalyzer:
         for proposal in move_proposals:
             move_map[proposal.source_path] = proposal.target_path
         
-        # Analyze each file being moved
-        for proposal in move_proposals:
-            source_file = proposal.source_path
-            target_file = proposal.target_path
-            
-            # Extract imports from the source file
-            imports = self.extract_imports(source_file)
-            self.file_imports[source_file] = imports
+        workers = min(self.READ_WORKERS, len(move_proposals))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            sources = pool.map(self._read_source, [p.source_path for p in move_proposals])
             
-            # Check each import for potential breakage
-            for import_stmt in imports:
-                warning = self._check_import_breakage(
-                    source_file, target_file, import_stmt, move_map
-                )
-                if warning:
-                    warnings.append(warning)
+            # Analyze each file being moved
+            for proposal, data in zip(move_proposals, sources):
+                source_file = proposal.source_path
+                target_file = proposal.target_path
+                
+                # Extract imports from the source file
+                if data is None:
+                    imports = []
+                else:
+                    imports = self.extract_imports_from_bytes(source_file, data)
+                self.file_imports[source_file] = imports
+                
+                # Check each import for potential breakage
+                for import_stmt in imports:
+                    warning = self._check_import_breakage(
+                        source_file, target_file, import_stmt, move_map
+                    )
+                    if warning:
+                        warnings.append(warning)
         
         return warnings
     
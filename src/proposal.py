@@ -1,16 +1,30 @@
 """Proposal generation and output formatting."""
 from dataclasses import dataclass
 from enum import Enum
+from functools import total_ordering
 from typing import List, Dict
 import json
 from pathlib import Path
 
 
+@total_ordering
 class RiskLevel(Enum):
-    """Risk level for proposed changes."""
+    """Risk level for proposed changes.
+    
+    Values stay the serialized strings; levels compare by rank
+    (LOW < MEDIUM < HIGH).
+    """
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
+    
+    def __lt__(self, other):
+        if not isinstance(other, RiskLevel):
+            return NotImplemented
+        return _RISK_RANK[self] < _RISK_RANK[other]
+
+
+_RISK_RANK = {RiskLevel.LOW: 0, RiskLevel.MEDIUM: 1, RiskLevel.HIGH: 2}
 
 
 class ActionType(Enum):
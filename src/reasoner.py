@@ -1,27 +1,116 @@
 """Structure reasoner - generates proposals for file organization."""
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Set
+from typing import Callable, List, Dict, Set, Tuple
 import logging
 
 from .analyzer import FileMetadata
 from .classifier import FileClassifier, FileCategory
-from .proposal import ProposalGenerator, RiskLevel, ActionType
+from .proposal import Proposal, ProposalGenerator, RiskLevel, ActionType
 from .repo_type import RepoTypeDetector, RepoType
 from .ecosystem import get_profile_for_repo_type, EcosystemProfile
 
 logger = logging.getLogger(__name__)
 
+# Duplicate risk by lowercased filename
+# HIGH: critical configuration and dependency files; LOW: documentation and licenses
+_RISK_BY_NAME: Dict[str, RiskLevel] = {
+    name: RiskLevel.HIGH for name in (
+        'requirements.txt', '.env', 'dockerfile', 'docker-compose.yml',
+        'docker-compose.yaml', 'package.json', 'package-lock.json', 'yarn.lock',
+        'pipfile', 'pipfile.lock', 'setup.py', 'pyproject.toml',
+    )
+}
+_RISK_BY_NAME.update({
+    name: RiskLevel.LOW for name in (
+        'readme.md', 'changelog.md', 'license', 'license.md', 'license.txt',
+        'contributing.md',
+    )
+})
+
+# Duplicate risk by filename suffix (logs and temporary files)
+_RISK_BY_SUFFIX: Tuple[Tuple[str, RiskLevel], ...] = (
+    ('.log', RiskLevel.LOW),
+    ('.tmp', RiskLevel.LOW),
+)
+
+
+class ClassifiedFile:
+    """A classified file with the derived values the proposal passes reuse.
+    
+    Built once per file in generate_proposals so later passes don't keep
+    re-lowering names or re-stringifying paths.
+    """
+    
+    __slots__ = ('file', 'category', 'name_lower', 'ext', 'parts',
+                 'rel_path_str', 'parent_str')
+    
+    def __init__(self, file: FileMetadata, category: FileCategory):
+        self.file = file
+        self.category = category
+        self.name_lower = file.name_lower
+        self.ext = file.extension
+        self.parts = tuple(file.rel_path_str.split(os.sep))
+        self.rel_path_str = file.rel_path_str
+        self.parent_str = file.parent_str
+
 
 class StructureReasoner:
     """Analyzes repository structure and generates improvement proposals."""
     
     # Structural Python files that should not trigger duplicate detection
-    DUPLICATE_EXEMPT_FILES = {
+    DUPLICATE_EXEMPT_FILES = frozenset({
         '__init__.py',
         '__main__.py',
         'conftest.py',
+    })
+    
+    # Top-level directories that already count as the right home for a category
+    CATEGORY_CORRECT_DIRS = {
+        FileCategory.SRC: frozenset({'src'}),
+        FileCategory.TESTS: frozenset({'tests', 'test'}),
+        FileCategory.CONFIGS: frozenset({'configs', 'config'}),
+        FileCategory.SCRIPTS: frozenset({'scripts'}),
+        FileCategory.DOCS: frozenset({'docs'}),
+        FileCategory.MARKDOWN: frozenset({'docs', 'markdown'}),
+        FileCategory.DATA: frozenset({'data'}),
+        FileCategory.EXPERIMENTS: frozenset({'experiments', 'playground'}),
     }
     
+    # Config files that belong at the repository root rather than configs/
+    ROOT_CONFIGS = frozenset({
+        'setup.py', 'setup.cfg', 'pyproject.toml',
+        'requirements.txt', '.gitignore',
+    })
+    
+    # Low-signal informational FLAG reasons, suppressed when the same file has a MOVE
+    REDUNDANT_FLAG_PATTERNS = (
+        "Python file at repository root",
+        # Add more patterns here as needed
+    )
+    
+    # Config wording: whole-name matches win over extension matches, and
+    # anything else falls back to a substring scan (extensions first)
+    CONFIG_BY_NAME = {
+        '.env': 'environment variables',
+        'requirements.txt': 'Python dependencies',
+        'Pipfile': 'Python dependencies',
+        'Pipfile.lock': 'Python dependencies',
+        'pyproject.toml': 'Python project metadata',
+    }
+    CONFIG_BY_EXT = {
+        '.env': 'environment variables',
+        '.yaml': 'YAML configuration',
+        '.yml': 'YAML configuration',
+        '.toml': 'TOML configuration',
+        '.ini': 'INI configuration',
+        '.json': 'JSON configuration',
+    }
+    CONFIG_BY_SUBSTRING = tuple(CONFIG_BY_EXT.items()) + tuple(CONFIG_BY_NAME.items())
+    
     def __init__(self, repo_path: Path):
         """Initialize reasoner."""
         self.repo_path = repo_path
@@ -30,6 +119,18 @@ class StructureReasoner:
         self.detector = RepoTypeDetector()
         self.repo_type = None
         self.ecosystem_profile: EcosystemProfile = None
+        self._reason_handlers: Dict[FileCategory, Callable[[ClassifiedFile, str], List[str]]] = {
+            FileCategory.TESTS: self._reason_tests,
+            FileCategory.SRC: self._reason_src,
+            FileCategory.SCRIPTS: self._reason_scripts,
+            FileCategory.CONFIGS: self._reason_configs,
+            FileCategory.EXPERIMENTS: self._reason_experiments,
+            FileCategory.MARKDOWN: self._reason_markdown,
+            FileCategory.DATA: self._reason_data,
+        }
+        self._redundant_re = re.compile(
+            "|".join(map(re.escape, self.REDUNDANT_FLAG_PATTERNS))
+        )
     
     def generate_proposals(self, files: List[FileMetadata]) -> ProposalGenerator:
         """Generate all proposals for the repository."""
@@ -37,12 +138,12 @@ class StructureReasoner:
         
         # Step 1: Detect repository type
         self.repo_type = self.detector.detect(files)
-        logger.info(f"Repository type: {self.repo_type.value}")
+        logger.info("Repository type: %s", self.repo_type.value)
         
         # V2: Select ecosystem profile based on repository type
         # V2: Enables suppression of expected framework duplicates (e.g., index.html in Next.js)
         self.ecosystem_profile = get_profile_for_repo_type(self.repo_type)
-        logger.info(f"Using ecosystem profile: {self.ecosystem_profile.name}")
+        logger.info("Using ecosystem profile: %s", self.ecosystem_profile.name)
         
         # Step 2: Add informational message for non-Python repos
         if self.repo_type == RepoType.NON_PYTHON:
@@ -51,75 +152,74 @@ class StructureReasoner:
         elif self.repo_type == RepoType.MIXED:
             logger.info("Mixed repository detected. MOVE proposals limited to Python files only.")
         
-        # Step 3: Classify all files first
-        classifications = {}
-        for file in files:
-            category = self.classifier.classify(file)
-            classifications[str(file.relative_path)] = (file, category)
+        # Step 3: Classify all files once, caching derived per-file values
+        classified = [ClassifiedFile(file, self.classifier.classify(file)) for file in files]
         
         # Step 4: Generate proposals based on repo type
         if self.repo_type == RepoType.PYTHON_DOMINANT:
             # Full proposal generation for Python repos
-            for rel_path, (file, category) in classifications.items():
-                self._propose_for_file(file, category)
+            for entry in classified:
+                self._propose_for_file(entry)
         elif self.repo_type == RepoType.MIXED:
             # Only propose moves for Python files
-            for rel_path, (file, category) in classifications.items():
-                if file.extension == '.py':
-                    self._propose_for_file(file, category)
+            for entry in classified:
+                if entry.ext == '.py':
+                    self._propose_for_file(entry)
         # For NON_PYTHON: skip MOVE proposals entirely
         
         # Step 5: Always detect duplicates and orphans (all repo types)
-        self._detect_duplicates(files)
-        self._detect_orphans(files)
+        # The two scans are independent, so run them side by side and merge
+        # their FLAGs in a fixed order (duplicates first) afterwards.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            duplicate_flags = pool.submit(self._detect_duplicates, classified)
+            orphan_flags = pool.submit(self._detect_orphans, classified)
+            self.generator.proposals.extend(duplicate_flags.result())
+            self.generator.proposals.extend(orphan_flags.result())
         
         # Step 6: FINAL SAFETY CHECK - Drop MOVE proposals for non-Python repos
-        if self.repo_type != RepoType.PYTHON_DOMINANT:
-            original_count = self.generator.get_count()
-            move_proposals = self.generator.get_by_action(ActionType.MOVE)
-            
-            # Remove all MOVE proposals
-            self.generator.proposals = [
-                p for p in self.generator.proposals 
-                if p.action != ActionType.MOVE
-            ]
-            
-            if len(move_proposals) > 0:
-                logger.info(f"Dropped {len(move_proposals)} MOVE proposals (non-Python repository)")
-        
         # Step 7: Suppress redundant FLAG proposals when MOVE exists
-        self._suppress_redundant_flags()
+        # (both applied in a single pass over the proposal list)
+        self._filter_proposals(drop_moves=self.repo_type != RepoType.PYTHON_DOMINANT)
         
-        logger.info(f"Generated {self.generator.get_count()} proposals")
+        logger.info("Generated %d proposals", self.generator.get_count())
         return self.generator
     
-    def _propose_for_file(self, file: FileMetadata, category: FileCategory):
+    def _propose_for_file(self, entry: ClassifiedFile):
         """Generate proposal for a single file."""
+        file = entry.file
+        category = entry.category
         current_path = file.relative_path
-        current_parts = current_path.parts
+        
+        if category == FileCategory.TRASH:
+            # Flag for review, don't auto-move
+            self.generator.add_flag(
+                source=current_path,
+                reason="Could not classify - needs manual review",
+                risk=RiskLevel.LOW,
+                category=category.value,
+            )
+            return
         
         # Skip if already in correct location
-        if self._is_correctly_placed(current_path, category):
+        parts = entry.parts
+        if len(parts) > 1 and parts[0] in self.CATEGORY_CORRECT_DIRS.get(category, ()):
             return
         
         # Generate target path based on category
-        target_path = self._generate_target_path(file, category)
+        target_path = self._generate_target_path(entry)
         
         if target_path is None:
             return
         
-        # Skip no-op moves (source == target)
-        # Resolve both paths to normalize separators and compare
-        source_resolved = Path(current_path)
-        target_resolved = Path(target_path)
-        if source_resolved == target_resolved:
+        # Skip no-op moves (source == target); both are already Paths
+        if current_path == target_path:
             return
         
         # Calculate risk level
         risk = self._assess_risk(file, category)
         
         # Generate reason
-        reason = self._generate_reason(file, category)
+        reason = self._generate_reason(entry)
         
         # Add proposal
         self.generator.add_move(
@@ -128,45 +228,18 @@ class StructureReasoner:
             reason=reason,
             risk=risk,
             category=category.value,
-            current_location=str(current_path.parent) if current_path.parent != Path('.') else 'root',
+            current_location=entry.parent_str if entry.parent_str != '.' else 'root',
         )
     
-    def _is_correctly_placed(self, path: Path, category: FileCategory) -> bool:
-        """Check if file is already in the correct location."""
-        parts = path.parts
-        if not parts:
-            return False
-        
-        first_dir = parts[0] if len(parts) > 1 else None
-        
-        # Check if file is already in the right category directory
-        if category == FileCategory.SRC and first_dir == 'src':
-            return True
-        elif category == FileCategory.TESTS and first_dir in ('tests', 'test'):
-            return True
-        elif category == FileCategory.CONFIGS and first_dir in ('configs', 'config'):
-            return True
-        elif category == FileCategory.SCRIPTS and first_dir == 'scripts':
-            return True
-        elif category == FileCategory.DOCS and first_dir == 'docs':
-            return True
-        elif category == FileCategory.MARKDOWN and first_dir in ('docs', 'markdown'):
-            return True
-        elif category == FileCategory.DATA and first_dir == 'data':
-            return True
-        elif category == FileCategory.EXPERIMENTS and first_dir in ('experiments', 'playground'):
-            return True
-        
-        return False
-    
-    def _generate_target_path(self, file: FileMetadata, category: FileCategory) -> Path:
+    def _generate_target_path(self, entry: ClassifiedFile) -> Path:
         """Generate target path for a file based on its category."""
-        name = file.name
-        current_path = file.relative_path
+        name = entry.file.name
+        current_path = entry.file.relative_path
+        category = entry.category
         
         if category == FileCategory.SRC:
             # Try to preserve package structure
-            if len(current_path.parts) > 1:
+            if len(entry.parts) > 1:
                 # Has subdirectories, preserve structure
                 return Path('src') / current_path
             else:
@@ -184,15 +257,14 @@ class StructureReasoner:
                 new_name = name
             
             # Try to mirror src structure
-            if len(current_path.parts) > 1:
+            if len(entry.parts) > 1:
                 return Path('tests') / current_path.parent / new_name
             else:
                 return Path('tests') / new_name
         
         elif category == FileCategory.CONFIGS:
             # Keep configs at root or in configs/
-            if name in ('setup.py', 'setup.cfg', 'pyproject.toml', 
-                       'requirements.txt', '.gitignore'):
+            if name in self.ROOT_CONFIGS:
                 return Path(name)  # Root level
             else:
                 return Path('configs') / name
@@ -205,7 +277,7 @@ class StructureReasoner:
         
         elif category == FileCategory.MARKDOWN:
             # README.md at root, others in docs/
-            if name.upper() == 'README.MD':
+            if entry.name_lower == 'readme.md':
                 return Path('README.md')
             else:
                 return Path('docs') / name
@@ -216,16 +288,7 @@ class StructureReasoner:
         elif category == FileCategory.EXPERIMENTS:
             return Path('experiments') / name
         
-        elif category == FileCategory.TRASH:
-            # Flag for review, don't auto-move
-            self.generator.add_flag(
-                source=current_path,
-                reason="Could not classify - needs manual review",
-                risk=RiskLevel.LOW,
-                category=category.value,
-            )
-            return None
-        
+        # TRASH and UNKNOWN never get a target (see _propose_for_file)
         return None
     
     def _assess_risk(self, file: FileMetadata, category: FileCategory) -> RiskLevel:
@@ -250,176 +313,186 @@ class StructureReasoner:
         # Default to low
         return RiskLevel.LOW
     
-    def _generate_reason(self, file: FileMetadata, category: FileCategory) -> str:
+    def _generate_reason(self, entry: ClassifiedFile) -> str:
         """Generate human-readable reason for the proposal.
         
         V2.2: Enhanced explanations for better decision support.
         Maps directly to classification logic - no AI hallucination.
+        Category-specific wording comes from the handlers in _reason_handlers.
         """
+        handler = self._reason_handlers.get(entry.category)
+        if handler is not None:
+            current_location = entry.parent_str if entry.parent_str != '.' else 'repository root'
+            reasons = handler(entry, current_location)
+        else:
+            reasons = []
+        
+        # Fallback
+        if not reasons:
+            reasons.append(f"Classified as {entry.category.value} based on file analysis")
+        
+        return ". ".join(reasons) + "."
+    
+    def _reason_tests(self, entry: ClassifiedFile, current_location: str) -> List[str]:
+        """Explain a TESTS classification."""
+        file = entry.file
         reasons = []
-        current_location = str(file.relative_path.parent) if file.relative_path.parent != Path('.') else 'repository root'
-        
-        if category == FileCategory.TESTS:
-            # Explain why it's a test file
-            if file.has_tests:
-                reasons.append("Contains test functions or test classes (pytest/unittest pattern detected)")
-            if any(imp in self.classifier.TEST_IMPORT_PATTERNS for imp in file.imports):
-                test_frameworks = [imp for imp in file.imports if imp in self.classifier.TEST_IMPORT_PATTERNS]
-                reasons.append(f"Imports testing frameworks: {', '.join(test_frameworks[:2])}")
-            if file.name.startswith('test_') or file.name.endswith('_test.py'):
-                reasons.append("Follows test file naming convention")
-            
-            # Explain why it needs to move
-            if current_location not in ['tests', 'test']:
-                reasons.append(f"Currently located in {current_location}, should be in tests/ directory")
-        
-        elif category == FileCategory.SRC:
-            # Explain why it's application code
-            if file.imports:
-                reasons.append(f"Contains {len(file.imports)} imports, indicating application logic")
-            if len(file.imports) > 5:
-                reasons.append("Multiple dependencies suggest core application module")
-            if not file.has_tests and not file.is_executable:
-                reasons.append("Non-executable library code (not a script)")
-            
-            # Explain why it needs to move
-            if current_location == 'repository root':
-                reasons.append("Python modules should be organized under src/ or package directory")
         
-        elif category == FileCategory.SCRIPTS:
-            # Explain why it's a script
-            if file.is_executable:
-                reasons.append("Contains __main__ block, indicating executable entry point")
-            if file.name in ['setup.py', 'manage.py', 'run.py']:
-                reasons.append("Common script name pattern detected")
-            
-            # Explain why it needs to move
-            if current_location == 'repository root':
-                reasons.append("Executable scripts should be organized in scripts/ directory")
+        # Explain why it's a test file
+        if file.has_tests:
+            reasons.append("Contains test functions or test classes (pytest/unittest pattern detected)")
+        test_patterns = self.classifier.TEST_IMPORT_PATTERNS
+        test_frameworks = [imp for imp in file.imports if imp in test_patterns]
+        if test_frameworks:
+            reasons.append(f"Imports testing frameworks: {', '.join(test_frameworks[:2])}")
+        if file.name.startswith('test_') or file.name.endswith('_test.py'):
+            reasons.append("Follows test file naming convention")
+        
+        # Explain why it needs to move
+        if current_location not in ['tests', 'test']:
+            reasons.append(f"Currently located in {current_location}, should be in tests/ directory")
+        
+        return reasons
+    
+    def _reason_src(self, entry: ClassifiedFile, current_location: str) -> List[str]:
+        """Explain a SRC classification."""
+        file = entry.file
+        reasons = []
         
-        elif category == FileCategory.CONFIGS:
-            # Explain what kind of config it is
-            config_types = {
-                '.env': 'environment variables',
-                '.yaml': 'YAML configuration',
-                '.yml': 'YAML configuration',
-                '.toml': 'TOML configuration',
-                '.ini': 'INI configuration',
-                '.json': 'JSON configuration',
-                'requirements.txt': 'Python dependencies',
-                'Pipfile': 'Python dependencies',
-                'pyproject.toml': 'Python project metadata',
-            }
-            
-            for pattern, config_type in config_types.items():
-                if pattern in file.name:
-                    reasons.append(f"Configuration file: {config_type}")
-                    break
-            
-            if not reasons:
-                reasons.append("Configuration file detected by naming pattern")
-            
-            # Keep root configs at root
-            if file.name in ['setup.py', 'setup.cfg', 'pyproject.toml', 'requirements.txt']:
-                reasons.append("Standard root-level configuration file")
-            elif current_location not in ['configs', 'config']:
-                reasons.append("Should be organized in configs/ directory")
+        # Explain why it's application code
+        if file.imports:
+            reasons.append(f"Contains {len(file.imports)} imports, indicating application logic")
+        if len(file.imports) > 5:
+            reasons.append("Multiple dependencies suggest core application module")
+        if not file.has_tests and not file.is_executable:
+            reasons.append("Non-executable library code (not a script)")
         
-        elif category == FileCategory.EXPERIMENTS:
-            # Explain why it's experimental
-            if 'test' in file.name.lower() or 'temp' in file.name.lower():
-                reasons.append("Temporary or experimental file naming pattern")
-            if 'playground' in str(file.relative_path).lower():
-                reasons.append("Located in experimental/playground area")
-            reasons.append("Consider moving to experiments/ or removing if obsolete")
+        # Explain why it needs to move
+        if current_location == 'repository root':
+            reasons.append("Python modules should be organized under src/ or package directory")
         
-        elif category == FileCategory.MARKDOWN:
-            # Explain why it's documentation
-            if file.name.upper() == 'README.MD':
-                reasons.append("Primary project README - should remain at repository root")
-            else:
-                reasons.append("Markdown documentation file")
-                if current_location == 'repository root':
-                    reasons.append("Documentation files should be organized in docs/ directory")
+        return reasons
+    
+    def _reason_scripts(self, entry: ClassifiedFile, current_location: str) -> List[str]:
+        """Explain a SCRIPTS classification."""
+        file = entry.file
+        reasons = []
         
-        elif category == FileCategory.DATA:
-            # Explain what kind of data
-            data_types = {
-                '.json': 'JSON data',
-                '.csv': 'CSV data',
-                '.txt': 'text data',
-                '.xml': 'XML data',
-                '.yaml': 'YAML data',
-            }
-            
-            for ext, data_type in data_types.items():
-                if file.extension == ext:
-                    reasons.append(f"Data file: {data_type}")
-                    break
-            
-            if not reasons:
-                reasons.append("Data file detected")
-            
+        # Explain why it's a script
+        if file.is_executable:
+            reasons.append("Contains __main__ block, indicating executable entry point")
+        if file.name in ['setup.py', 'manage.py', 'run.py']:
+            reasons.append("Common script name pattern detected")
+        
+        # Explain why it needs to move
+        if current_location == 'repository root':
+            reasons.append("Executable scripts should be organized in scripts/ directory")
+        
+        return reasons
+    
+    def _reason_configs(self, entry: ClassifiedFile, current_location: str) -> List[str]:
+        """Explain a CONFIGS classification."""
+        file = entry.file
+        reasons = []
+        
+        # Explain what kind of config it is
+        config_type = self.CONFIG_BY_NAME.get(file.name) or self.CONFIG_BY_EXT.get(entry.ext)
+        if config_type is None:
+            # e.g. .env.example, requirements.txt.bak
+            config_type = next((wording for pattern, wording in self.CONFIG_BY_SUBSTRING
+                                if pattern in file.name), None)
+        if config_type:
+            reasons.append(f"Configuration file: {config_type}")
+        
+        if not reasons:
+            reasons.append("Configuration file detected by naming pattern")
+        
+        # Keep root configs at root
+        if file.name in ['setup.py', 'setup.cfg', 'pyproject.toml', 'requirements.txt']:
+            reasons.append("Standard root-level configuration file")
+        elif current_location not in ['configs', 'config']:
+            reasons.append("Should be organized in configs/ directory")
+        
+        return reasons
+    
+    def _reason_experiments(self, entry: ClassifiedFile, current_location: str) -> List[str]:
+        """Explain an EXPERIMENTS classification."""
+        reasons = []
+        
+        # Explain why it's experimental
+        if 'test' in entry.name_lower or 'temp' in entry.name_lower:
+            reasons.append("Temporary or experimental file naming pattern")
+        if 'playground' in entry.rel_path_str.lower():
+            reasons.append("Located in experimental/playground area")
+        reasons.append("Consider moving to experiments/ or removing if obsolete")
+        
+        return reasons
+    
+    def _reason_markdown(self, entry: ClassifiedFile, current_location: str) -> List[str]:
+        """Explain a MARKDOWN classification."""
+        reasons = []
+        
+        # Explain why it's documentation
+        if entry.name_lower == 'readme.md':
+            reasons.append("Primary project README - should remain at repository root")
+        else:
+            reasons.append("Markdown documentation file")
             if current_location == 'repository root':
-                reasons.append("Data files should be organized in data/ directory")
+                reasons.append("Documentation files should be organized in docs/ directory")
+        
+        return reasons
+    
+    def _reason_data(self, entry: ClassifiedFile, current_location: str) -> List[str]:
+        """Explain a DATA classification."""
+        reasons = []
+        
+        # Explain what kind of data
+        data_types = {
+            '.json': 'JSON data',
+            '.csv': 'CSV data',
+            '.txt': 'text data',
+            '.xml': 'XML data',
+            '.yaml': 'YAML data',
+        }
+        
+        for ext, data_type in data_types.items():
+            if entry.ext == ext:
+                reasons.append(f"Data file: {data_type}")
+                break
         
-        # Fallback
         if not reasons:
-            reasons.append(f"Classified as {category.value} based on file analysis")
+            reasons.append("Data file detected")
         
-        return ". ".join(reasons) + "."
+        if current_location == 'repository root':
+            reasons.append("Data files should be organized in data/ directory")
+        
+        return reasons
     
-    def _assess_duplicate_risk(self, filename: str) -> RiskLevel:
+    def _assess_duplicate_risk(self, filename_lower: str) -> RiskLevel:
         """Assess risk level for duplicate files based on filename patterns.
         
+        Args:
+            filename_lower: Already-lowercased filename (the duplicate group key)
+        
         Heuristics:
         - HIGH: Critical config/dependency files (requirements.txt, .env, Dockerfile, package.json)
         - LOW: Documentation (README.md, *.md), logs (*.log), temporary files
         - MEDIUM: Everything else (default for duplicates)
         """
-        filename_lower = filename.lower()
-        
-        # HIGH risk: Critical configuration and dependency files
-        high_risk_patterns = [
-            'requirements.txt',
-            '.env',
-            'dockerfile',
-            'docker-compose.yml',
-            'docker-compose.yaml',
-            'package.json',
-            'package-lock.json',
-            'yarn.lock',
-            'pipfile',
-            'pipfile.lock',
-            'setup.py',
-            'pyproject.toml',
-        ]
-        
-        if filename_lower in high_risk_patterns:
-            return RiskLevel.HIGH
-        
-        # LOW risk: Documentation and logs
-        low_risk_patterns = [
-            'readme.md',
-            'changelog.md',
-            'license',
-            'license.md',
-            'license.txt',
-            'contributing.md',
-        ]
-        
-        if filename_lower in low_risk_patterns:
-            return RiskLevel.LOW
+        risk = _RISK_BY_NAME.get(filename_lower)
+        if risk is not None:
+            return risk
         
         # LOW risk: Log files and temporary files
-        if filename_lower.endswith('.log') or filename_lower.endswith('.tmp'):
-            return RiskLevel.LOW
+        for suffix, suffix_risk in _RISK_BY_SUFFIX:
+            if filename_lower.endswith(suffix):
+                return suffix_risk
         
         # MEDIUM risk: Default for all other duplicates
         return RiskLevel.MEDIUM
     
-    def _detect_duplicates(self, files: List[FileMetadata]):
-        """V2: Detect potential duplicate files and emit grouped FLAGs.
+    def _detect_duplicates(self, classified: List[ClassifiedFile]) -> List[Proposal]:
+        """V2: Detect potential duplicate files and return grouped FLAGs.
         
         V2 Behavior:
         - Emits ONE FLAG per duplicate group (not one per file)
@@ -427,111 +500,130 @@ class StructureReasoner:
         - Respects ecosystem profile suppression (e.g., index.html in Next.js)
         - Maintains risk stratification (HIGH/MEDIUM/LOW)
         """
-        by_name = {}
-        for file in files:
-            name = file.name.lower()
-            
+        profile = self.ecosystem_profile
+        flags = []
+        
+        by_name = defaultdict(list)
+        for entry in classified:
             # Skip structural Python files
-            if file.name in self.DUPLICATE_EXEMPT_FILES:
+            if entry.file.name in self.DUPLICATE_EXEMPT_FILES:
                 continue
             
-            if name not in by_name:
-                by_name[name] = []
-            by_name[name].append(file)
-        
-        for name, file_list in by_name.items():
-            if len(file_list) > 1:
-                # V2: Check if ecosystem profile suppresses this duplicate
-                if self.ecosystem_profile and self.ecosystem_profile.should_suppress_duplicate(file_list[0].name):
-                    logger.debug(f"Suppressing duplicate for {file_list[0].name} (ecosystem: {self.ecosystem_profile.name})")
-                    continue
-                
-                # Assess risk based on filename
-                risk = self._assess_duplicate_risk(file_list[0].name)
-                
-                # V2 GROUPED DUPLICATE FLAG: Emit one FLAG per duplicate group
-                # V2: Include up to 3 example paths, indicate remaining count
-                total_count = len(file_list)
-                example_paths = [str(f.relative_path) for f in file_list[:3]]
-                remaining = total_count - 3
-                
-                # Build the reason with examples
-                reason = f"Duplicate filename: {total_count} files named '{file_list[0].name}'"
-                
-                # Build details with all paths for reference
-                all_paths = [str(f.relative_path) for f in file_list]
-                details = {
-                    'total_count': total_count,
-                    'examples': example_paths,
-                    'all_duplicates': all_paths,
-                }
-                
-                if remaining > 0:
-                    details['remaining'] = f"+{remaining} more"
-                
-                # Emit single grouped FLAG using first file as the source
-                self.generator.add_flag(
-                    source=file_list[0].relative_path,
-                    reason=reason,
-                    risk=risk,
-                    **details,
-                    )
+            by_name[entry.name_lower].append(entry)
+        
+        duplicate_groups = ((name, file_list) for name, file_list in by_name.items()
+                            if len(file_list) > 1)
+        for name, file_list in duplicate_groups:
+            first = file_list[0].file
+            
+            # V2: Check if ecosystem profile suppresses this duplicate
+            if profile and profile.should_suppress_duplicate(name):
+                logger.debug("Suppressing duplicate for %s (ecosystem: %s)", first.name, profile.name)
+                continue
+            
+            # Assess risk based on filename
+            risk = self._assess_duplicate_risk(name)
+            
+            # V2 GROUPED DUPLICATE FLAG: Emit one FLAG per duplicate group
+            # V2: Include up to 3 example paths, indicate remaining count
+            total_count = len(file_list)
+            example_paths = [e.rel_path_str for e in file_list[:3]]
+            remaining = total_count - 3
+            
+            # Build the reason with examples
+            reason = f"Duplicate filename: {total_count} files named '{first.name}'"
+            
+            # Build details with all paths for reference
+            all_paths = [e.rel_path_str for e in file_list]
+            details = {
+                'total_count': total_count,
+                'examples': example_paths,
+                'all_duplicates': all_paths,
+            }
+            
+            if remaining > 0:
+                details['remaining'] = f"+{remaining} more"
+            
+            # Emit single grouped FLAG using first file as the source
+            flags.append(Proposal(
+                action=ActionType.FLAG,
+                source_path=first.relative_path,
+                reason=reason,
+                risk_level=risk,
+                details=details,
+            ))
+        
+        return flags
     
-    def _detect_orphans(self, files: List[FileMetadata]):
-        """Detect orphaned or isolated files."""
+    def _detect_orphans(self, classified: List[ClassifiedFile]) -> List[Proposal]:
+        """Detect orphaned or isolated files and return FLAGs for them."""
+        flags = []
+        
         # Only flag orphans in Python-dominant repos
         if self.repo_type != RepoType.PYTHON_DOMINANT:
-            return
+            return flags
         
         # Files at root that shouldn't be there
-        for file in files:
-            if len(file.relative_path.parts) == 1:  # At root
-                if file.extension == '.py':
+        for entry in classified:
+            if len(entry.parts) == 1:  # At root
+                if entry.ext == '.py':
                     # Python files at root are often misplaced
-                    if file.name not in ('setup.py', 'manage.py'):
-                        self.generator.add_flag(
-                            source=file.relative_path,
+                    if entry.file.name not in ('setup.py', 'manage.py'):
+                        flags.append(Proposal(
+                            action=ActionType.FLAG,
+                            source_path=entry.file.relative_path,
                             reason="Python file at repository root",
-                            risk=RiskLevel.LOW,
-                            suggestion="Consider moving to src/ or scripts/",
-                        )
+                            risk_level=RiskLevel.LOW,
+                            details={'suggestion': "Consider moving to src/ or scripts/"},
+                        ))
+        
+        return flags
     
-    def _suppress_redundant_flags(self):
-        """Suppress low-signal FLAG proposals when MOVE proposal exists for same file.
+    def _filter_proposals(self, drop_moves: bool):
+        """Drop disallowed MOVEs and suppress redundant FLAGs in one pass.
         
         Rules:
+        - If drop_moves is set (non-Python repos), remove every MOVE proposal
         - If a file has a MOVE proposal, suppress informational FLAGs
         - Keep duplicate-detection FLAGs (they provide different signal)
         - Suppression happens at output stage, not during detection
         """
-        # Build set of files with MOVE proposals
-        files_with_moves = set()
-        for proposal in self.generator.proposals:
-            if proposal.action == ActionType.MOVE:
-                files_with_moves.add(str(proposal.source_path))
-        
-        # Define redundant FLAG patterns (low-signal informational flags)
-        redundant_patterns = [
-            "Python file at repository root",
-            # Add more patterns here as needed
-        ]
-        
-        # Filter proposals: keep all MOVEs and non-redundant FLAGs
-        original_count = len(self.generator.proposals)
-        self.generator.proposals = [
-            p for p in self.generator.proposals
-            if not (
+        proposals = self.generator.proposals
+        
+        # Build set of files with (surviving) MOVE proposals
+        if drop_moves:
+            files_with_moves = set()
+        else:
+            files_with_moves = {
+                str(p.source_path) for p in proposals
+                if p.action == ActionType.MOVE
+            }
+        
+        kept = []
+        dropped_count = 0
+        suppressed_count = 0
+        for p in proposals:
+            if p.action == ActionType.MOVE:
+                if drop_moves:
+                    dropped_count += 1
+                    continue
+            elif (
                 # Only filter FLAGs (keep all MOVEs and DELETEs)
                 p.action == ActionType.FLAG
                 # Only if the file also has a MOVE
                 and str(p.source_path) in files_with_moves
                 # Only if it's a redundant informational FLAG
-                and any(pattern in p.reason for pattern in redundant_patterns)
+                and self._redundant_re.search(p.reason)
                 # Never filter duplicate detection FLAGs
                 and not p.reason.startswith("Duplicate filename:")
-            )
-        ]
+            ):
+                suppressed_count += 1
+                continue
+            kept.append(p)
+        
+        self.generator.proposals = kept
         
-        suppressed_count = original_count - len(self.generator.proposals)
+        if dropped_count > 0:
+            logger.info("Dropped %d MOVE proposals (non-Python repository)", dropped_count)
         if suppressed_count > 0:
-            logger.info(f"Suppressed {suppressed_count} redundant FLAG proposals")
+            logger.info("Suppressed %d redundant FLAG proposals", suppressed_count)
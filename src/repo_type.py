@@ -1,4 +1,5 @@
 """Repository type detection module."""
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List
 from enum import Enum
@@ -18,27 +19,27 @@ class RepoTypeDetector:
     """Detects repository type using simple heuristics."""
     
     # Python-specific indicators
-    PYTHON_ROOT_FILES = {
+    PYTHON_ROOT_FILES = frozenset({
         'setup.py', 'setup.cfg', 'pyproject.toml',
         'requirements.txt', 'Pipfile', 'poetry.lock',
         'tox.ini', 'pytest.ini',
-    }
+    })
     
     # Non-Python framework indicators
-    FRONTEND_FILES = {
+    FRONTEND_FILES = frozenset({
         'package.json', 'package-lock.json', 'yarn.lock',
         'angular.json', 'tsconfig.json', 'webpack.config.js',
         'vite.config.js', 'next.config.js',
-    }
+    })
     
-    JAVA_FILES = {'pom.xml', 'build.gradle', 'gradlew'}
-    DOTNET_FILES = {'.csproj', '.sln', '.fsproj', '.vbproj'}
-    RUBY_FILES = {'Gemfile', 'Rakefile'}
-    GO_FILES = {'go.mod', 'go.sum'}
+    JAVA_FILES = frozenset({'pom.xml', 'build.gradle', 'gradlew'})
+    DOTNET_FILES = frozenset({'.csproj', '.sln', '.fsproj', '.vbproj'})
+    RUBY_FILES = frozenset({'Gemfile', 'Rakefile'})
+    GO_FILES = frozenset({'go.mod', 'go.sum'})
     
     def __init__(self):
         """Initialize detector."""
-        self.extension_counts: Dict[str, int] = {}
+        self.extension_counts: Dict[str, int] = Counter()
         self.root_files: set = set()
     
     def detect(self, files: List) -> RepoType:
@@ -51,16 +52,10 @@ class RepoTypeDetector:
             RepoType classification
         """
         # Count extensions
-        self.extension_counts = {}
-        self.root_files = set()
+        self.extension_counts = Counter(file.extension or 'no_extension' for file in files)
         
-        for file in files:
-            ext = file.extension or 'no_extension'
-            self.extension_counts[ext] = self.extension_counts.get(ext, 0) + 1
-            
-            # Track root-level files
-            if len(file.relative_path.parts) == 1:
-                self.root_files.add(file.name)
+        # Track root-level files (cached parent string avoids building parts tuples)
+        self.root_files = {file.name for file in files if file.parent_str == '.'}
         
         # Check for Python indicators
         python_score = self._calculate_python_score()
@@ -69,11 +64,11 @@ class RepoTypeDetector:
         non_python_score = self._calculate_non_python_score()
         
         # Classify
-        total_files = sum(self.extension_counts.values())
-        py_percentage = self.extension_counts.get('.py', 0) / max(total_files, 1) * 100
+        total_files = len(files)
+        py_percentage = self.extension_counts['.py'] / max(total_files, 1) * 100
         
-        logger.info(f"Repository detection: {py_percentage:.1f}% Python files")
-        logger.info(f"Python score: {python_score}, Non-Python score: {non_python_score}")
+        logger.info("Repository detection: %.1f%% Python files", py_percentage)
+        logger.info("Python score: %s, Non-Python score: %s", python_score, non_python_score)
         
         # Decision logic
         if python_score >= 3 and py_percentage >= 50:
@@ -94,7 +89,7 @@ class RepoTypeDetector:
         score += len(python_root_matches) * 2
         
         # .py file count
-        py_count = self.extension_counts.get('.py', 0)
+        py_count = self.extension_counts['.py']
         if py_count > 10:
             score += 3
         elif py_count > 5:
@@ -120,16 +115,12 @@ class RepoTypeDetector:
         if self.root_files & self.RUBY_FILES:
             score += 3
         
-        # Check for .NET in any file
-        if any(ext in ['.csproj', '.sln', '.fsproj', '.vbproj'] 
-               for ext in self.extension_counts.keys()):
+        # Check for .NET in any file (DOTNET_FILES holds project/solution extensions)
+        if self.DOTNET_FILES & self.extension_counts.keys():
             score += 3
         
         # TypeScript/JavaScript dominance
-        ts_js_count = (self.extension_counts.get('.ts', 0) + 
-                       self.extension_counts.get('.js', 0) + 
-                       self.extension_counts.get('.tsx', 0) + 
-                       self.extension_counts.get('.jsx', 0))
+        ts_js_count = sum(self.extension_counts[ext] for ext in ('.ts', '.js', '.tsx', '.jsx'))
         
         if ts_js_count > 20:
             score += 2
@@ -5,9 +5,12 @@ V2.3: Added import breakage warnings (preflight checks).
 V2.4: Added confidence scoring and Git awareness.
 No execution risk - read-only simulation only.
 """
+import heapq
+import sys
+from functools import cached_property
 from pathlib import Path
 from typing import List, Dict, Set, Tuple, Optional
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from .proposal import Proposal, ActionType, RiskLevel
 from .import_analyzer import ImportAnalyzer, ImportWarning
@@ -15,6 +18,10 @@ from .confidence import ConfidenceScore
 from .git_detector import GitDetector
 from .repo_type import RepoType
 
+# Pre-bound enum members for the per-proposal loops (identity compares, no attribute lookups)
+_MOVE = ActionType.MOVE
+_FLAG = ActionType.FLAG
+
 
 class TreeNode:
     """Represents a node in the directory tree."""
@@ -23,44 +30,72 @@ class TreeNode:
         self.name = name
         self.is_file = is_file
         self.children: Dict[str, TreeNode] = {}
+        self._sorted_children: Optional[List[Tuple[str, TreeNode]]] = None  # Cached render order
     
     def add_path(self, path: Path):
         """Add a path to the tree."""
         parts = path.parts
-        if not parts:
-            return
-        
-        first = parts[0]
-        if first not in self.children:
-            is_file = len(parts) == 1
-            self.children[first] = TreeNode(first, is_file=is_file)
+        last = len(parts) - 1
+        
+        # Walk down one level per part, creating missing nodes on the way
+        node = self
+        for i, name in enumerate(parts):
+            # Components like 'src' or 'tests' repeat across paths; intern for cheap dict hits
+            name = sys.intern(name)
+            child = node.children.get(name)
+            if child is None:
+                child = TreeNode(name, is_file=(i == last))
+                node.children[name] = child
+                node._sorted_children = None
+            node = child
+    
+    def _get_sorted_children(self) -> List[Tuple[str, 'TreeNode']]:
+        """Children in render order (directories first, then by name).
         
-        if len(parts) > 1:
-            self.children[first].add_path(Path(*parts[1:]))
+        Cached until a new child is added.
+        """
+        if self._sorted_children is None:
+            self._sorted_children = sorted(self.children.items(), key=lambda x: (x[1].is_file, x[0]))
+        return self._sorted_children
     
-    def render(self, prefix: str = "", is_last: bool = True) -> List[str]:
-        """Render the tree as a list of formatted strings."""
-        lines = []
+    def render(self, prefix_parts: Optional[List[str]] = None, is_last: bool = True,
+               lines: Optional[List[str]] = None) -> List[str]:
+        """Render the tree as a list of formatted strings.
+        
+        Walks the tree with an explicit stack rather than recursion. Each
+        directory joins its children's prefix once and shares it with all
+        of them.
         
-        if self.name != ".":
-            connector = "└── " if is_last else "├── "
-            suffix = "/" if not self.is_file else ""
-            lines.append(f"{prefix}{connector}{self.name}{suffix}")
+        Args:
+            prefix_parts: Indentation pieces inherited from ancestors (empty at the root)
+            is_last: Whether this node is the last child of its parent
+            lines: Optional buffer to append into (a new list is created if omitted)
+        
+        Returns:
+            The list the lines were appended to
+        """
+        if lines is None:
+            lines = []
+        stack = [(self, "".join(prefix_parts or ()), is_last)]
+        
+        while stack:
+            node, prefix, last = stack.pop()
+            child_prefix = prefix
+            
+            if node.name != ".":
+                connector = "└── " if last else "├── "
+                suffix = "/" if not node.is_file else ""
+                lines.append(prefix + connector + node.name + suffix)
+                
+                if not node.is_file:
+                    child_prefix = prefix + ("    " if last else "│   ")
             
-            if not self.is_file:
-                extension = "    " if is_last else "│   "
-                new_prefix = prefix + extension
-            else:
-                new_prefix = prefix
-        else:
-            new_prefix = prefix
-        
-        # Render children
-        if not self.is_file:
-            children = sorted(self.children.items(), key=lambda x: (x[1].is_file, x[0]))
-            for i, (name, child) in enumerate(children):
-                is_last_child = (i == len(children) - 1)
-                lines.extend(child.render(new_prefix, is_last_child))
+            # Queue children, pushed in reverse so they pop in sorted order
+            if not node.is_file:
+                children = node._get_sorted_children()
+                last_index = len(children) - 1
+                for i in range(last_index, -1, -1):
+                    stack.append((children[i][1], child_prefix, i == last_index))
         
         return lines
 
@@ -73,6 +108,9 @@ class TreeDiffVisualizer:
     V2.4: Added confidence scoring and Git awareness.
     """
     
+    # Files shown per tree before truncating (shared by generate/render)
+    DEFAULT_MAX_FILES = 50
+    
     def __init__(self, proposals: List[Proposal], current_files: List[Path], 
                  repo_path: Optional[Path] = None, enable_import_check: bool = True,
                  repo_type: Optional[RepoType] = None, has_tests: bool = False,
@@ -90,8 +128,6 @@ class TreeDiffVisualizer:
         """
         self.proposals = proposals
         self.current_files = current_files
-        self.move_proposals = [p for p in proposals if p.action == ActionType.MOVE]
-        self.flag_proposals = [p for p in proposals if p.action == ActionType.FLAG]
         self.repo_path = repo_path
         self.enable_import_check = enable_import_check
         self.repo_type = repo_type
@@ -100,8 +136,46 @@ class TreeDiffVisualizer:
         self._import_warnings = None  # Cached warnings
         self._confidence_score = None  # Cached confidence
         self._git_warnings = None  # Cached git warnings
+        self._git_detector: Optional[GitDetector] = None  # Shared detector (keeps its own caches)
+        self._affected_set: Optional[Set[Path]] = None  # Cached unordered affected files
+        self._impact_summary: Optional[Dict] = None  # Cached impact summary
     
-    def generate_tree_diff(self, max_depth: int = 3, max_files: int = 50) -> Dict[str, str]:
+    @cached_property
+    def _partitions(self) -> Tuple[List[Proposal], List[Proposal], Dict[Path, Path]]:
+        """Split proposals into (moves, flags, move map) in a single pass, on first use.
+        
+        The move map (source -> target) is filled by the same loop, so it
+        never needs a second pass over the MOVE proposals.
+        """
+        moves: List[Proposal] = []
+        flags: List[Proposal] = []
+        move_map: Dict[Path, Path] = {}
+        for p in self.proposals:
+            action = p.action
+            if action is _MOVE:
+                moves.append(p)
+                move_map[p.source_path] = p.target_path
+            elif action is _FLAG:
+                flags.append(p)
+        return moves, flags, move_map
+    
+    @cached_property
+    def move_proposals(self) -> List[Proposal]:
+        """MOVE proposals, materialized on first access."""
+        return self._partitions[0]
+    
+    @cached_property
+    def flag_proposals(self) -> List[Proposal]:
+        """FLAG proposals, materialized on first access."""
+        return self._partitions[1]
+    
+    @property
+    def _move_map(self) -> Dict[Path, Path]:
+        """Source -> target for every MOVE proposal (built by the partition pass)."""
+        return self._partitions[2]
+    
+    def generate_tree_diff(self, max_depth: int = 3,
+                           max_files: int = DEFAULT_MAX_FILES) -> Dict[str, str]:
         """Generate before/after tree visualization.
         
         Args:
@@ -109,67 +183,84 @@ class TreeDiffVisualizer:
             max_files: Maximum files to show (for large repos)
         
         Returns:
-            Dict with 'before' and 'after' tree strings
+            Dict with 'before' and 'after' tree strings ('.' for both when
+            no files are affected)
+        """
+        if not self._get_affected_set():
+            return {'before': ".", 'after': "."}
+        
+        before_block, after_block = self._build_tree_blocks(max_files)
+        
+        return {
+            'before': "\n".join(before_block),
+            'after': "\n".join(after_block),
+        }
+    
+    def _build_tree_blocks(self, max_files: int) -> Tuple[List[str], List[str]]:
+        """Build the before/after tree blocks as lists of output lines.
+        
+        Each block starts with the '.' root line and ends with the truncation
+        notice when applicable, so callers can join once end-to-end.
         """
         # Build BEFORE tree (current state)
+        # Only the first max_files paths are shown, so select them without a full sort
         before_root = TreeNode(".")
-        affected_files = self._get_affected_files()
+        affected = self._get_affected_set()
         
-        for file_path in affected_files[:max_files]:
+        for file_path in heapq.nsmallest(max_files, affected):
             before_root.add_path(file_path)
         
         # Build AFTER tree (simulated state after moves)
         after_root = TreeNode(".")
-        after_files = self._simulate_after_state()
         
-        for file_path in after_files[:max_files]:
+        for file_path in self._simulate_after_state(limit=max_files):
             after_root.add_path(file_path)
         
-        # Render trees
-        before_lines = before_root.render()
-        after_lines = after_root.render()
+        # Render trees straight into their blocks
+        # (an empty tree still leaves a blank line under the root)
+        before_block = ["."]
+        after_block = ["."]
+        for root, block in ((before_root, before_block), (after_root, after_block)):
+            root.render(lines=block)
+            if len(block) == 1:
+                block.append("")
         
         # Truncation notice
-        truncated = len(affected_files) > max_files
-        truncation_note = f"\n... showing {max_files} of {len(affected_files)} affected files" if truncated else ""
+        if len(affected) > max_files:
+            truncation_note = f"... showing {max_files} of {len(affected)} affected files"
+            before_block.append(truncation_note)
+            after_block.append(truncation_note)
         
-        return {
-            'before': ".\n" + "\n".join(before_lines) + truncation_note,
-            'after': ".\n" + "\n".join(after_lines) + truncation_note
-        }
+        return before_block, after_block
     
-    def _get_affected_files(self) -> List[Path]:
-        """Get list of files affected by proposals."""
-        affected = set()
+    def _get_affected_set(self) -> Set[Path]:
+        """Get unordered set of files affected by proposals.
         
-        # Add all files that will be moved
-        for proposal in self.move_proposals:
-            affected.add(proposal.source_path)
+        Results are cached after first call.
+        """
+        if self._affected_set is not None:
+            return self._affected_set
         
-        # Add flagged files
-        for proposal in self.flag_proposals:
-            affected.add(proposal.source_path)
+        # All files that will be moved, plus flagged files
+        affected = {p.source_path for p in self.move_proposals}
+        affected.update(p.source_path for p in self.flag_proposals)
         
-        return sorted(affected)
+        self._affected_set = affected
+        return affected
     
-    def _simulate_after_state(self) -> List[Path]:
-        """Simulate file paths after all MOVE proposals are applied."""
-        # Start with affected files
-        files_map = {}
-        
-        # Map source -> target for all moves
-        for proposal in self.move_proposals:
-            files_map[proposal.source_path] = proposal.target_path
+    def _simulate_after_state(self, limit: Optional[int] = None) -> List[Path]:
+        """Simulate file paths after all MOVE proposals are applied.
         
-        # Apply transformations
-        after_files = []
-        for source in self._get_affected_files():
-            if source in files_map:
-                after_files.append(files_map[source])
-            else:
-                # Flagged but not moved
-                after_files.append(source)
+        Args:
+            limit: If given, return only the first `limit` paths in sorted order
+        """
+        files_map = self._move_map
         
+        # Moved files take their target; flagged-only files stay put.
+        # The mapped result is ordered here, so read sources from the unordered set.
+        after_files = (files_map.get(source, source) for source in self._get_affected_set())
+        if limit is not None:
+            return heapq.nsmallest(limit, after_files)
         return sorted(after_files)
     
     def generate_impact_summary(self) -> Dict:
@@ -182,7 +273,12 @@ class TreeDiffVisualizer:
             - new_directories: Set of new directories that will be created
             - risk_breakdown: Dict of risk level counts
             - duplicate_groups: Number of duplicate groups detected
+        
+        Results are cached after first call.
         """
+        if self._impact_summary is not None:
+            return self._impact_summary
+        
         # Count moves and flags
         total_moves = len(self.move_proposals)
         total_flags = len(self.flag_proposals)
@@ -190,32 +286,32 @@ class TreeDiffVisualizer:
         # Identify new directories
         new_dirs = set()
         for proposal in self.move_proposals:
-            target_path = proposal.target_path
-            # Get all parent directories
-            for parent in target_path.parents:
-                if parent != Path('.'):
-                    new_dirs.add(str(parent))
+            # Get all parent directories; the last parent of a relative path is always '.'
+            new_dirs.update(map(str, list(proposal.target_path.parents)[:-1]))
         
         # Count by risk level
+        risk_counts = Counter(p.risk_level for p in self.move_proposals)
         risk_breakdown = {
-            'high': sum(1 for p in self.move_proposals if p.risk_level == RiskLevel.HIGH),
-            'medium': sum(1 for p in self.move_proposals if p.risk_level == RiskLevel.MEDIUM),
-            'low': sum(1 for p in self.move_proposals if p.risk_level == RiskLevel.LOW),
+            'high': risk_counts[RiskLevel.HIGH],
+            'medium': risk_counts[RiskLevel.MEDIUM],
+            'low': risk_counts[RiskLevel.LOW],
         }
         
-        # Count duplicate groups (FLAGs with "Duplicate filename:")
+        # Count duplicate groups (FLAGs whose reason starts with "Duplicate filename:")
+        # Anchored prefix check, matching how the reasoner tells these FLAGs apart
         duplicate_groups = sum(
             1 for p in self.flag_proposals 
-            if 'Duplicate filename:' in p.reason
+            if p.reason.startswith('Duplicate filename:')
         )
         
-        return {
+        self._impact_summary = {
             'total_moves': total_moves,
             'total_flags': total_flags,
             'new_directories': sorted(new_dirs),
             'risk_breakdown': risk_breakdown,
             'duplicate_groups': duplicate_groups,
         }
+        return self._impact_summary
     
     def render_impact_summary(self) -> str:
         """Render impact summary as formatted text."""
@@ -264,20 +360,33 @@ class TreeDiffVisualizer:
         
         return "\n".join(lines)
     
-    def render_tree_diff(self) -> str:
-        """Render before/after tree diff as formatted text."""
-        diff = self.generate_tree_diff()
+    def render_tree_diff(self, max_files: int = DEFAULT_MAX_FILES) -> str:
+        """Render before/after tree diff as formatted text.
+        
+        Args:
+            max_files: Maximum files to show (for large repos)
+        """
+        lines = [
+            "=" * 60,
+            "DIRECTORY STRUCTURE PREVIEW",
+            "=" * 60,
+            "",
+        ]
+        
+        # Nothing moved or flagged: skip building and rendering empty trees
+        if not self._get_affected_set():
+            lines.append("No structural changes proposed.")
+            lines.append("")
+            lines.append("=" * 60)
+            return "\n".join(lines)
+        
+        before_block, after_block = self._build_tree_blocks(max_files)
         
-        lines = []
-        lines.append("=" * 60)
-        lines.append("DIRECTORY STRUCTURE PREVIEW")
-        lines.append("=" * 60)
-        lines.append("")
         lines.append("BEFORE (current):")
-        lines.append(diff['before'])
+        lines.extend(before_block)
         lines.append("")
         lines.append("AFTER (if proposals applied):")
-        lines.append(diff['after'])
+        lines.extend(after_block)
         lines.append("")
         lines.append("=" * 60)
         
@@ -389,8 +498,7 @@ class TreeDiffVisualizer:
             self._git_warnings = []
             return []
         
-        detector = GitDetector(self.repo_path)
-        self._git_warnings = detector.analyze_proposals(self.proposals)
+        self._git_warnings = self._get_git_detector().analyze_proposals(self.proposals)
         return self._git_warnings
     
     def render_git_warnings(self, warnings: Optional[List] = None) -> str:
@@ -405,9 +513,13 @@ class TreeDiffVisualizer:
         if not self.repo_path:
             return ""
         
-        detector = GitDetector(self.repo_path)
-        
         if warnings is None:
             warnings = self.generate_git_warnings()
         
-        return detector.render_warnings(warnings, self.proposals)
+        return self._get_git_detector().render_warnings(warnings, self.proposals)
+    
+    def _get_git_detector(self) -> GitDetector:
+        """Get the Git detector for repo_path, creating it on first use."""
+        if self._git_detector is None:
+            self._git_detector = GitDetector(self.repo_path)
+        return self._git_detector
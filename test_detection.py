@@ -1,9 +1,44 @@
 """Demo script to test repo type detection on different scenarios."""
 import tempfile
 from pathlib import Path
+
+import pytest
+
 from src.analyzer import FileMetadata, RepositoryAnalyzer
 from src.reasoner import StructureReasoner
 from src.proposal import ActionType
+from src.repo_type import RepoType
+
+# (title, layout, expected repo type, expectation printed by the demo)
+SCENARIOS = [
+    (
+        "Python Repository",
+        ('setup.py', 'requirements.txt', 'src/app.py', 'src/models.py',
+         'tests/test_app.py', 'README.md'),
+        RepoType.PYTHON_DOMINANT,
+        "✓ Python repo should have MOVE proposals",
+    ),
+    (
+        "Angular/TypeScript Repository",
+        ('package.json', 'angular.json', 'tsconfig.json',
+         'src/app/app.component.ts', 'src/app/app.module.ts',
+         'src/app/app.component.html', 'src/environments/environment.ts',
+         'README.md'),
+        RepoType.NON_PYTHON,
+        "✓ Non-Python repo should have NO MOVE proposals",
+    ),
+    (
+        "Mixed Python/JavaScript Repository",
+        ('requirements.txt', 'package.json', 'backend/app.py',
+         'backend/models.py', 'backend/utils.py', 'frontend/index.js',
+         'frontend/app.js', 'frontend/styles.css', 'README.md'),
+        RepoType.MIXED,
+        "✓ Mixed repo should only move Python files",
+    ),
+]
+
+# Root configs that may legitimately move in a mixed repo
+CONFIG_SUFFIXES = ('requirements.txt', '.gitignore')
 
 def create_test_file(base_path: Path, filename: str) -> Path:
     """Create a test file."""
@@ -12,91 +47,51 @@ def create_test_file(base_path: Path, filename: str) -> Path:
     file_path.touch()
     return file_path
 
-def test_python_repo():
-    """Test Python repository detection."""
-    print("\n" + "="*70)
-    print("TEST 1: Python Repository")
-    print("="*70)
+def run_scenario(base: Path, layout):
+    """Create the layout under base, then analyze it once.
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base = Path(tmpdir)
-        
-        # Create Python repo structure
-        create_test_file(base, 'setup.py')
-        create_test_file(base, 'requirements.txt')
-        create_test_file(base, 'src/app.py')
-        create_test_file(base, 'src/models.py')
-        create_test_file(base, 'tests/test_app.py')
-        create_test_file(base, 'README.md')
-        
-        analyzer = RepositoryAnalyzer(str(base))
-        files = analyzer.analyze()
-        
-        reasoner = StructureReasoner(base)
-        generator = reasoner.generate_proposals(files)
-        
-        print(f"Files analyzed: {len(files)}")
-        print(f"Repository type: {reasoner.repo_type.value}")
-        print(f"MOVE proposals: {len(generator.get_by_action(ActionType.MOVE))}")
-        print(f"FLAG proposals: {len(generator.get_by_action(ActionType.FLAG))}")
-        print("✓ Python repo should have MOVE proposals")
+    Returns:
+        Tuple of (files, reasoner, generator)
+    """
+    for filename in layout:
+        create_test_file(base, filename)
+    
+    analyzer = RepositoryAnalyzer(str(base))
+    files = analyzer.analyze()
+    
+    reasoner = StructureReasoner(base)
+    generator = reasoner.generate_proposals(files)
+    return files, reasoner, generator
 
-def test_angular_repo():
-    """Test Angular/TypeScript repository detection."""
-    print("\n" + "="*70)
-    print("TEST 2: Angular/TypeScript Repository")
-    print("="*70)
+@pytest.fixture(params=SCENARIOS, ids=lambda scenario: scenario[0])
+def scenario_result(request, tmp_path):
+    """Build and analyze one scenario; assertions share the single run."""
+    title, layout, expected_type, _ = request.param
+    files, reasoner, generator = run_scenario(tmp_path, layout)
+    return expected_type, files, reasoner, generator
+
+def test_repo_type_detection(scenario_result):
+    """Each scenario is detected as its expected repository type."""
+    expected_type, files, reasoner, generator = scenario_result
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base = Path(tmpdir)
-        
-        # Create Angular repo structure
-        create_test_file(base, 'package.json')
-        create_test_file(base, 'angular.json')
-        create_test_file(base, 'tsconfig.json')
-        create_test_file(base, 'src/app/app.component.ts')
-        create_test_file(base, 'src/app/app.module.ts')
-        create_test_file(base, 'src/app/app.component.html')
-        create_test_file(base, 'src/environments/environment.ts')
-        create_test_file(base, 'README.md')
-        
-        analyzer = RepositoryAnalyzer(str(base))
-        files = analyzer.analyze()
-        
-        reasoner = StructureReasoner(base)
-        generator = reasoner.generate_proposals(files)
-        
-        print(f"Files analyzed: {len(files)}")
-        print(f"Repository type: {reasoner.repo_type.value}")
-        print(f"MOVE proposals: {len(generator.get_by_action(ActionType.MOVE))}")
-        print(f"FLAG proposals: {len(generator.get_by_action(ActionType.FLAG))}")
-        print("✓ Non-Python repo should have NO MOVE proposals")
+    assert reasoner.repo_type == expected_type
+    
+    moves = generator.get_by_action(ActionType.MOVE)
+    if expected_type == RepoType.NON_PYTHON:
+        # Non-Python repos never get MOVE proposals
+        assert moves == []
+    elif expected_type == RepoType.MIXED:
+        # Mixed repos only move Python files
+        assert all(str(m.source_path).endswith('.py') for m in moves)
 
-def test_mixed_repo():
-    """Test mixed repository detection."""
+def print_scenario(number: int, title: str, layout, expectation: str):
+    """Run one scenario in a temporary directory and print its results."""
     print("\n" + "="*70)
-    print("TEST 3: Mixed Python/JavaScript Repository")
+    print(f"TEST {number}: {title}")
     print("="*70)
     
     with tempfile.TemporaryDirectory() as tmpdir:
-        base = Path(tmpdir)
-        
-        # Create mixed repo structure
-        create_test_file(base, 'requirements.txt')
-        create_test_file(base, 'package.json')
-        create_test_file(base, 'backend/app.py')
-        create_test_file(base, 'backend/models.py')
-        create_test_file(base, 'backend/utils.py')
-        create_test_file(base, 'frontend/index.js')
-        create_test_file(base, 'frontend/app.js')
-        create_test_file(base, 'frontend/styles.css')
-        create_test_file(base, 'README.md')
-        
-        analyzer = RepositoryAnalyzer(str(base))
-        files = analyzer.analyze()
-        
-        reasoner = StructureReasoner(base)
-        generator = reasoner.generate_proposals(files)
+        files, reasoner, generator = run_scenario(Path(tmpdir), layout)
         
         print(f"Files analyzed: {len(files)}")
         print(f"Repository type: {reasoner.repo_type.value}")
@@ -104,25 +99,29 @@ def test_mixed_repo():
         moves = generator.get_by_action(ActionType.MOVE)
         print(f"MOVE proposals: {len(moves)}")
         
-        # Check that only .py files have moves
-        py_moves = [m for m in moves if str(m.source_path).endswith('.py')]
-        non_py_moves = [m for m in moves if not str(m.source_path).endswith('.py') 
-                       and not any(str(m.source_path).endswith(cfg) 
-                                 for cfg in ['requirements.txt', '.gitignore'])]
+        if reasoner.repo_type == RepoType.MIXED:
+            # Check that only .py files have moves (single pass over moves)
+            py_moves, non_py_moves = [], []
+            for m in moves:
+                source = str(m.source_path)
+                if source.endswith('.py'):
+                    py_moves.append(m)
+                elif not source.endswith(CONFIG_SUFFIXES):
+                    non_py_moves.append(m)
+            
+            print(f"Python file moves: {len(py_moves)}")
+            print(f"Non-Python file moves: {len(non_py_moves)}")
         
-        print(f"Python file moves: {len(py_moves)}")
-        print(f"Non-Python file moves: {len(non_py_moves)}")
         print(f"FLAG proposals: {len(generator.get_by_action(ActionType.FLAG))}")
-        print("✓ Mixed repo should only move Python files")
+        print(expectation)
 
 if __name__ == "__main__":
     print("\n" + "#"*70)
     print("# REPOSITORY TYPE DETECTION DEMO")
     print("#"*70)
     
-    test_python_repo()
-    test_angular_repo()
-    test_mixed_repo()
+    for number, (title, layout, _, expectation) in enumerate(SCENARIOS, 1):
+        print_scenario(number, title, layout, expectation)
     
     print("\n" + "="*70)
     print("SUMMARY")
@@ -0,0 +1,51 @@
+"""Shared pytest fixtures."""
+import os
+
+import pytest
+
+# O_CLOEXEC is POSIX-only
+_CREATE_FLAGS = os.O_CREAT | os.O_WRONLY | getattr(os, 'O_CLOEXEC', 0)
+
+
+# Fixtures that put a test on the real file system. Only these are detected;
+# a test that creates files through tempfile must carry the marker itself.
+_FILESYSTEM_FIXTURES = frozenset({'tmp_path', 'tmp_path_factory', 'sample_repo', 'test_file'})
+
+
+def pytest_collection_modifyitems(items):
+    """Mark tests that touch the disk so in-memory ones can be selected alone."""
+    for item in items:
+        if not _FILESYSTEM_FIXTURES.isdisjoint(getattr(item, 'fixturenames', ())):
+            item.add_marker(pytest.mark.filesystem)
+
+
+def make_file(path) -> None:
+    """Create an empty file (open + close, without Path.touch()'s utime)."""
+    os.close(os.open(path, _CREATE_FLAGS, 0o644))
+
+
+@pytest.fixture(scope="session")
+def sample_repo(tmp_path_factory):
+    """Create a small read-only sample repository once per test session.
+    
+    Layout:
+        README.md
+        src/app.py
+        tests/test_app.py
+        venv/script.py  (should be ignored by the analyzer)
+    """
+    repo = tmp_path_factory.mktemp("sample_repo")
+    
+    # Create test structure
+    (repo / 'src').mkdir()
+    (repo / 'tests').mkdir()
+    (repo / 'venv').mkdir()  # Should be ignored
+    
+    # Create test files
+    make_file(repo / 'README.md')
+    (repo / 'src' / 'app.py').write_text('import os\n\nprint("hello")')
+    (repo / 'tests' / 'test_app.py').write_text('def test_foo():\n    pass')
+    make_file(repo / 'venv' / 'script.py')  # Should be ignored
+    
+    return repo
+
@@ -1,43 +1,27 @@
 """Tests for the repository analyzer."""
 import pytest
 from pathlib import Path
-import tempfile
-import os
 
 from src.analyzer import RepositoryAnalyzer, FileMetadata
+from tests.conftest import make_file
 
 
 class TestRepositoryAnalyzer:
     """Test suite for RepositoryAnalyzer."""
     
-    def setup_method(self):
-        """Set up test repository."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        
-        # Create test structure
-        (self.temp_dir / 'src').mkdir()
-        (self.temp_dir / 'tests').mkdir()
-        (self.temp_dir / 'venv').mkdir()  # Should be ignored
-        
-        # Create test files
-        (self.temp_dir / 'README.md').touch()
-        (self.temp_dir / 'src' / 'app.py').write_text('import os\n\nprint("hello")')
-        (self.temp_dir / 'tests' / 'test_app.py').write_text('def test_foo():\n    pass')
-        (self.temp_dir / 'venv' / 'script.py').touch()  # Should be ignored
-    
-    def test_analyzer_initialization(self):
+    def test_analyzer_initialization(self, sample_repo):
         """Test that analyzer initializes correctly."""
-        analyzer = RepositoryAnalyzer(str(self.temp_dir))
-        assert analyzer.repo_path == self.temp_dir
+        analyzer = RepositoryAnalyzer(str(sample_repo))
+        assert analyzer.repo_path == sample_repo
     
     def test_invalid_path_raises_error(self):
         """Test that invalid paths raise errors."""
         with pytest.raises(ValueError):
             RepositoryAnalyzer('/nonexistent/path')
     
-    def test_analyze_finds_files(self):
+    def test_analyze_finds_files(self, sample_repo):
         """Test that analyze finds all non-ignored files."""
-        analyzer = RepositoryAnalyzer(str(self.temp_dir))
+        analyzer = RepositoryAnalyzer(str(sample_repo))
         files = analyzer.analyze()
         
         # Should find README, app.py, test_app.py
@@ -50,48 +34,65 @@ class TestRepositoryAnalyzer:
         assert 'test_app.py' in filenames
         assert 'script.py' not in filenames  # In venv, should be ignored
     
-    def test_ignore_patterns(self):
+    def test_ignored_directories_are_not_descended(self, sample_repo, monkeypatch):
+        """Test that the walk prunes ignored directories instead of filtering their files."""
+        analyzer = RepositoryAnalyzer(str(sample_repo))
+        checked = []
+        original = analyzer.should_ignore
+        
+        def recording_should_ignore(path):
+            checked.append(path)
+            return original(path)
+        
+        monkeypatch.setattr(analyzer, 'should_ignore', recording_should_ignore)
+        analyzer.analyze()
+        
+        venv = sample_repo / 'venv'
+        assert venv in checked
+        assert not any(venv in path.parents for path in checked)
+    
+    def test_ignore_patterns(self, sample_repo):
         """Test that ignore patterns work correctly."""
-        analyzer = RepositoryAnalyzer(str(self.temp_dir))
+        analyzer = RepositoryAnalyzer(str(sample_repo))
         
         # Should ignore venv directory
-        assert analyzer.should_ignore(self.temp_dir / 'venv')
-        assert analyzer.should_ignore(self.temp_dir / 'venv' / 'script.py')
+        assert analyzer.should_ignore(sample_repo / 'venv')
+        assert analyzer.should_ignore(sample_repo / 'venv' / 'script.py')
         
         # Should ignore .pyc files
-        assert analyzer.should_ignore(self.temp_dir / 'test.pyc')
+        assert analyzer.should_ignore(sample_repo / 'test.pyc')
         
         # Should NOT ignore normal files
-        assert not analyzer.should_ignore(self.temp_dir / 'app.py')
+        assert not analyzer.should_ignore(sample_repo / 'app.py')
     
-    def test_path_containment_exclusion(self):
+    def test_path_containment_exclusion(self, sample_repo):
         """Test that path containment correctly excludes vendored directories."""
-        analyzer = RepositoryAnalyzer(str(self.temp_dir))
+        analyzer = RepositoryAnalyzer(str(sample_repo))
         
         # Should ignore paths CONTAINING venv-related strings
-        assert analyzer.should_ignore(self.temp_dir / 'venv_new' / 'lib' / 'script.py')
-        assert analyzer.should_ignore(self.temp_dir / 'my_venv' / 'script.py')
-        assert analyzer.should_ignore(self.temp_dir / '.venv' / 'script.py')
+        assert analyzer.should_ignore(sample_repo / 'venv_new' / 'lib' / 'script.py')
+        assert analyzer.should_ignore(sample_repo / 'my_venv' / 'script.py')
+        assert analyzer.should_ignore(sample_repo / '.venv' / 'script.py')
         
         # Should ignore paths containing site-packages
-        assert analyzer.should_ignore(self.temp_dir / 'venv_new' / 'Lib' / 'site-packages' / 'torch' / 'nn.py')
-        assert analyzer.should_ignore(self.temp_dir / 'lib' / 'site-packages' / 'numpy' / 'core.py')
+        assert analyzer.should_ignore(sample_repo / 'venv_new' / 'Lib' / 'site-packages' / 'torch' / 'nn.py')
+        assert analyzer.should_ignore(sample_repo / 'lib' / 'site-packages' / 'numpy' / 'core.py')
         
         # Should ignore paths containing node_modules
-        assert analyzer.should_ignore(self.temp_dir / 'node_modules' / 'react' / 'index.js')
-        assert analyzer.should_ignore(self.temp_dir / 'frontend' / 'node_modules' / 'package.json')
+        assert analyzer.should_ignore(sample_repo / 'node_modules' / 'react' / 'index.js')
+        assert analyzer.should_ignore(sample_repo / 'frontend' / 'node_modules' / 'package.json')
         
         # Should ignore paths containing build/dist
-        assert analyzer.should_ignore(self.temp_dir / 'build' / 'output.js')
-        assert analyzer.should_ignore(self.temp_dir / 'dist' / 'bundle.js')
+        assert analyzer.should_ignore(sample_repo / 'build' / 'output.js')
+        assert analyzer.should_ignore(sample_repo / 'dist' / 'bundle.js')
         
         # Should NOT ignore normal paths with similar but different names
-        assert not analyzer.should_ignore(self.temp_dir / 'environment.py')
-        assert not analyzer.should_ignore(self.temp_dir / 'convention.py')
+        assert not analyzer.should_ignore(sample_repo / 'environment.py')
+        assert not analyzer.should_ignore(sample_repo / 'convention.py')
     
-    def test_python_file_analysis(self):
+    def test_python_file_analysis(self, sample_repo):
         """Test that Python files are analyzed for imports."""
-        analyzer = RepositoryAnalyzer(str(self.temp_dir))
+        analyzer = RepositoryAnalyzer(str(sample_repo))
         files = analyzer.analyze()
         
         # Find the app.py file
@@ -99,9 +100,29 @@ class TestRepositoryAnalyzer:
         assert app_file is not None
         assert 'os' in app_file.imports
     
-    def test_test_file_detection(self):
+    def test_semicolon_separated_imports(self, tmp_path):
+        """Test every statement on a `;`-joined line is scanned for imports."""
+        file_path = tmp_path / 'mod.py'
+        file_path.write_bytes(b'import os; import sys\nx = 1; from json import loads\n')
+        
+        metadata = FileMetadata(file_path, tmp_path)
+        RepositoryAnalyzer(str(tmp_path))._analyze_python_file(metadata)
+        
+        assert metadata.imports == ['os', 'sys', 'json']
+    
+    def test_docstring_import_lines_are_counted(self, tmp_path):
+        """Test the regex scan counts import lines inside docstrings (accepted heuristic)."""
+        file_path = tmp_path / 'mod.py'
+        file_path.write_bytes(b'"""Usage:\n\nimport requests\n"""\nimport os\n')
+        
+        metadata = FileMetadata(file_path, tmp_path)
+        RepositoryAnalyzer(str(tmp_path))._analyze_python_file(metadata)
+        
+        assert metadata.imports == ['requests', 'os']
+    
+    def test_test_file_detection(self, sample_repo):
         """Test that test files are detected."""
-        analyzer = RepositoryAnalyzer(str(self.temp_dir))
+        analyzer = RepositoryAnalyzer(str(sample_repo))
         files = analyzer.analyze()
         
         # Find test_app.py
@@ -109,9 +130,21 @@ class TestRepositoryAnalyzer:
         assert test_file is not None
         assert test_file.has_tests
     
-    def test_get_summary(self):
+    def test_parallel_analysis_matches_serial(self, tmp_path, monkeypatch):
+        """Thread-pool metadata extraction keeps walk order and results."""
+        for i in range(80):
+            (tmp_path / f'mod_{i:02d}.py').write_text(f'import os\nimport pkg_{i}\n')
+        
+        parallel = RepositoryAnalyzer(str(tmp_path)).analyze()
+        monkeypatch.setattr(RepositoryAnalyzer, 'MAX_WORKERS', 1)
+        serial = RepositoryAnalyzer(str(tmp_path)).analyze()
+        
+        assert [f.rel_path_str for f in parallel] == [f.rel_path_str for f in serial]
+        assert [f.imports for f in parallel] == [f.imports for f in serial]
+    
+    def test_get_summary(self, sample_repo):
         """Test summary statistics."""
-        analyzer = RepositoryAnalyzer(str(self.temp_dir))
+        analyzer = RepositoryAnalyzer(str(sample_repo))
         analyzer.analyze()
         summary = analyzer.get_summary()
         
@@ -125,28 +158,32 @@ class TestRepositoryAnalyzer:
 class TestFileMetadata:
     """Test FileMetadata class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
-    def test_metadata_initialization(self):
+    def test_metadata_initialization(self, tmp_path):
         """Test FileMetadata initialization."""
-        file_path = self.temp_dir / 'test.py'
-        file_path.touch()
+        file_path = tmp_path / 'test.py'
+        make_file(file_path)
         
-        metadata = FileMetadata(file_path, self.temp_dir)
+        metadata = FileMetadata(file_path, tmp_path)
         
         assert metadata.path == file_path
         assert metadata.name == 'test.py'
         assert metadata.extension == '.py'
         assert metadata.relative_path == Path('test.py')
     
-    def test_metadata_to_dict(self):
+    def test_metadata_uses_known_size(self, tmp_path):
+        """Test that a size supplied by the walker is used without re-stat'ing."""
+        file_path = tmp_path / 'data.bin'
+        file_path.write_bytes(b'12345')
+        
+        assert FileMetadata(file_path, tmp_path).size == 5
+        assert FileMetadata(file_path, tmp_path, size=42).size == 42
+    
+    def test_metadata_to_dict(self, tmp_path):
         """Test metadata conversion to dictionary."""
-        file_path = self.temp_dir / 'test.py'
-        file_path.touch()
+        file_path = tmp_path / 'test.py'
+        make_file(file_path)
         
-        metadata = FileMetadata(file_path, self.temp_dir)
+        metadata = FileMetadata(file_path, tmp_path)
         metadata.imports = ['os', 'sys']
         
         data = metadata.to_dict()
@@ -154,3 +191,15 @@ class TestFileMetadata:
         assert data['name'] == 'test.py'
         assert data['extension'] == '.py'
         assert data['imports'] == ['os', 'sys']
+    
+    def test_metadata_cached_path_strings(self, tmp_path):
+        """Test derived path strings are cached at construction."""
+        file_path = tmp_path / 'pkg' / 'Module.py'
+        file_path.parent.mkdir()
+        make_file(file_path)
+        
+        metadata = FileMetadata(file_path, tmp_path)
+        
+        assert metadata.rel_path_str == str(Path('pkg') / 'Module.py')
+        assert metadata.parent_str == 'pkg'
+        assert metadata.name_lower == 'module.py'
@@ -1,11 +1,28 @@
 """Tests for the file classifier."""
 import pytest
 from pathlib import Path
-import tempfile
 import os
 
 from src.analyzer import FileMetadata
 from src.classifier import FileClassifier, FileCategory
+from tests.conftest import make_file
+
+# Nonexistent repository root for metadata that never touches the disk
+VIRTUAL_ROOT = Path('/virtual_repo')
+
+
+def ensure_files(root: Path, *filenames: str) -> list:
+    """Create empty files under root with one makedirs per new parent.
+    
+    Parents equal to root already exist, so files at the top level cost
+    a single open/close each.
+    """
+    paths = [root / filename for filename in filenames]
+    for parent in {path.parent for path in paths} - {root}:
+        os.makedirs(parent, exist_ok=True)
+    for path in paths:
+        make_file(path)
+    return paths
 
 
 class TestFileClassifier:
@@ -14,15 +31,14 @@ class TestFileClassifier:
     def setup_method(self):
         """Set up test fixtures."""
         self.classifier = FileClassifier()
-        self.temp_dir = Path(tempfile.mkdtemp())
     
     def create_metadata(self, filename: str, **kwargs) -> FileMetadata:
-        """Helper to create FileMetadata for testing."""
-        file_path = self.temp_dir / filename
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
+        """Helper to create in-memory FileMetadata for testing.
         
-        metadata = FileMetadata(file_path, self.temp_dir)
+        classify() only reads names, paths and the analyzed flags, so the
+        file never needs to exist; passing size skips the stat.
+        """
+        metadata = FileMetadata(VIRTUAL_ROOT / filename, VIRTUAL_ROOT, size=0)
         
         # Apply custom attributes
         for key, value in kwargs.items():
@@ -36,26 +52,24 @@ class TestFileClassifier:
         category = self.classifier.classify(metadata)
         assert category == FileCategory.MARKDOWN
     
-    def test_config_file_classification(self):
+    @pytest.mark.parametrize('filename', [
+        # By filename
+        'setup.py', 'requirements.txt', 'pyproject.toml',
+        # By extension
+        'config.yaml',
+    ])
+    def test_config_file_classification(self, filename):
         """Test configuration file classification."""
-        # Test by filename
-        for filename in ['setup.py', 'requirements.txt', 'pyproject.toml']:
-            metadata = self.create_metadata(filename)
-            category = self.classifier.classify(metadata)
-            assert category == FileCategory.CONFIGS, f"Failed for {filename}"
-        
-        # Test by extension
-        metadata = self.create_metadata('config.yaml')
+        metadata = self.create_metadata(filename)
         category = self.classifier.classify(metadata)
         assert category == FileCategory.CONFIGS
     
-    def test_data_file_classification(self):
+    @pytest.mark.parametrize('ext', ['.csv', '.json', '.sqlite', '.pkl'])
+    def test_data_file_classification(self, ext):
         """Test data file classification."""
-        for ext in ['.csv', '.json', '.sqlite', '.pkl']:
-            filename = f'data{ext}'
-            metadata = self.create_metadata(filename)
-            category = self.classifier.classify(metadata)
-            assert category == FileCategory.DATA, f"Failed for {filename}"
+        metadata = self.create_metadata(f'data{ext}')
+        category = self.classifier.classify(metadata)
+        assert category == FileCategory.DATA
     
     def test_test_file_classification(self):
         """Test file classification by various indicators."""
@@ -86,12 +100,12 @@ class TestFileClassifier:
         category = self.classifier.classify(metadata)
         assert category == FileCategory.SCRIPTS
     
-    def test_experiment_file_classification(self):
+    @pytest.mark.parametrize('name', ['temp_test.py', 'experiment_1.py', 'playground.py', 'scratch.py'])
+    def test_experiment_file_classification(self, name):
         """Test experimental file classification."""
-        for name in ['temp_test.py', 'experiment_1.py', 'playground.py', 'scratch.py']:
-            metadata = self.create_metadata(name)
-            category = self.classifier.classify(metadata)
-            assert category == FileCategory.EXPERIMENTS, f"Failed for {name}"
+        metadata = self.create_metadata(name)
+        category = self.classifier.classify(metadata)
+        assert category == FileCategory.EXPERIMENTS
     
     def test_source_file_classification(self):
         """Test source code classification."""
@@ -138,17 +152,15 @@ class TestFileClassifier:
 class TestClassificationRules:
     """Test specific classification rules."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self, tmp_path):
         """Set up test fixtures."""
         self.classifier = FileClassifier()
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = tmp_path
     
     def create_metadata(self, filename: str, **kwargs) -> FileMetadata:
         """Helper to create FileMetadata for testing."""
-        file_path = self.temp_dir / filename
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
-        
+        file_path, = ensure_files(self.temp_dir, filename)
         metadata = FileMetadata(file_path, self.temp_dir)
         
         for key, value in kwargs.items():
@@ -158,21 +170,13 @@ class TestClassificationRules:
     
     def test_file_in_test_directory(self):
         """Files in test directories should be classified as tests."""
-        file_path = self.temp_dir / 'tests' / 'foo.py'
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
-        
-        metadata = FileMetadata(file_path, self.temp_dir)
+        metadata = self.create_metadata('tests/foo.py')
         category = self.classifier.classify(metadata)
         assert category == FileCategory.TESTS
     
     def test_file_in_src_directory(self):
         """Files in src directory should be classified as source."""
-        file_path = self.temp_dir / 'src' / 'app.py'
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
-        
-        metadata = FileMetadata(file_path, self.temp_dir)
+        metadata = self.create_metadata('src/app.py')
         metadata.imports = ['os', 'sys', 'pathlib']  # Some imports
         category = self.classifier.classify(metadata)
         assert category == FileCategory.SRC
@@ -7,10 +7,10 @@ from src.proposal import Proposal, ActionType, RiskLevel
 from src.repo_type import RepoType
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_proposals():
-    """Create sample proposals for testing."""
-    return [
+    """Create sample proposals once; ConfidenceScore only reads them."""
+    return (
         Proposal(
             action=ActionType.MOVE,
             source_path=Path("test_file.py"),
@@ -35,7 +35,7 @@ def sample_proposals():
             risk_level=RiskLevel.HIGH,
             details={}
         )
-    ]
+    )
 
 
 class TestConfidenceLevel:
@@ -46,6 +46,13 @@ class TestConfidenceLevel:
         assert ConfidenceLevel.HIGH.value == "HIGH"
         assert ConfidenceLevel.MEDIUM.value == "MEDIUM"
         assert ConfidenceLevel.LOW.value == "LOW"
+    
+    def test_confidence_levels_are_ordered(self):
+        """Test that levels compare by rank, not by their string values."""
+        assert ConfidenceLevel.LOW < ConfidenceLevel.MEDIUM < ConfidenceLevel.HIGH
+        assert max(ConfidenceLevel) == ConfidenceLevel.HIGH
+        assert RiskLevel.LOW < RiskLevel.MEDIUM < RiskLevel.HIGH
+        assert sorted([RiskLevel.HIGH, RiskLevel.LOW]) == [RiskLevel.LOW, RiskLevel.HIGH]
 
 
 class TestConfidenceScore:
@@ -149,11 +156,7 @@ class TestConfidenceScore:
         )
         
         # More warnings should lower or maintain confidence level
-        confidence_order = [ConfidenceLevel.LOW, ConfidenceLevel.MEDIUM, ConfidenceLevel.HIGH]
-        no_warn_idx = confidence_order.index(confidence_no_warnings.confidence_level)
-        with_warn_idx = confidence_order.index(confidence_with_warnings.confidence_level)
-        
-        assert with_warn_idx <= no_warn_idx
+        assert confidence_with_warnings.confidence_level <= confidence_no_warnings.confidence_level
     
     def test_many_moves_lowers_confidence(self):
         """Test that many moves lower confidence."""
@@ -209,6 +212,9 @@ class TestConfidenceScore:
         assert "REORGANIZATION CONFIDENCE" in text
         assert confidence.confidence_level.value in text
         assert "Positive factors:" in text or "Risk factors:" in text
+        
+        # Rendered once, then reused
+        assert confidence.to_text() is text
         assert "Interpretation:" in text
     
     def test_get_summary_returns_dict(self, sample_proposals):
@@ -1,14 +1,141 @@
 """Tests for the proposal executor module (V2.1)."""
-import tempfile
-import shutil
+import errno
 from pathlib import Path
 import json
+import os
 import pytest
 
+from src import executor as executor_module
 from src.executor import ProposalExecutor, ExecutionResult
 from src.proposal import Proposal, ActionType, RiskLevel
 
 
+def load_history(path: Path) -> list:
+    """Parse a history log from one contiguous read."""
+    return json.loads(path.read_bytes())
+
+
+@pytest.fixture
+def test_file(tmp_path):
+    """A source file to move, at the root of the per-test repository."""
+    path = tmp_path / 'test.py'
+    path.write_bytes(b'print("test")')
+    return path
+
+
+# Paths are immutable, so the ones most tests use are parsed once
+TEST_PY = Path('test.py')
+SRC_TEST_PY = Path('src/test.py')
+
+# Field overrides for the summary proposals: two moves that succeed and a
+# FLAG the executor skips (built fresh per test by make_proposal)
+SUMMARY_PROPOSAL_FIELDS = (
+    {'source_path': Path('file1.py'), 'target_path': Path('src/file1.py'), 'reason': "Move"},
+    {'source_path': Path('file2.py'), 'target_path': Path('src/file2.py'), 'reason': "Move"},
+    {'source_path': Path('file3.py'), 'target_path': None, 'action': ActionType.FLAG,
+     'reason': "Flag", 'risk_level': RiskLevel.HIGH},
+)
+
+
+# Pre-serialized history logs for the rollback validation tests
+# A successful MOVE whose target was never actually created
+FAKE_HISTORY_SINGLE = json.dumps([{
+    'timestamp': '2025-12-19T12:00:00',
+    'action': 'MOVE',
+    'source': 'test.py',
+    'target': 'src/test.py',
+    'success': True,
+    'skipped': False,
+    'risk': 'low',
+    'message': 'Moved'
+}]).encode()
+
+# One successful MOVE, one failed MOVE and a FLAG; only the first can be undone
+FAKE_HISTORY_MIXED = json.dumps([
+    {
+        'timestamp': '2025-12-19T12:00:00',
+        'action': 'MOVE',
+        'source': 'test1.py',
+        'target': 'src/test1.py',
+        'success': True,
+        'skipped': False,
+        'risk': 'low',
+        'message': 'Moved'
+    },
+    {
+        'timestamp': '2025-12-19T12:01:00',
+        'action': 'MOVE',
+        'source': 'test2.py',
+        'target': 'src/test2.py',
+        'success': False,  # Failed move
+        'skipped': False,
+        'risk': 'low',
+        'message': 'Failed'
+    },
+    {
+        'timestamp': '2025-12-19T12:02:00',
+        'action': 'FLAG',  # Non-MOVE action
+        'source': 'test3.py',
+        'target': None,
+        'success': True,
+        'skipped': False,
+        'risk': 'low',
+        'message': 'Flagged'
+    }
+]).encode()
+
+
+@pytest.fixture(scope="class")
+def make_proposal():
+    """Factory for proposals; defaults to moving test.py into src/.
+    
+    Every call builds a new Proposal, so tests never share a mutable one.
+    """
+    def _make(source_path=TEST_PY, target_path=SRC_TEST_PY, action=ActionType.MOVE,
+              reason="Test move", risk_level=RiskLevel.LOW):
+        return Proposal(action=action, source_path=source_path, target_path=target_path,
+                        reason=reason, risk_level=risk_level)
+    return _make
+
+
+@pytest.fixture
+def summary_proposals(make_proposal):
+    """Fresh proposals built from SUMMARY_PROPOSAL_FIELDS."""
+    return [make_proposal(**fields) for fields in SUMMARY_PROPOSAL_FIELDS]
+
+
+@pytest.fixture
+def move_batch(make_proposal):
+    """Three independent moves, test{i}.py -> src/test{i}.py."""
+    return [make_proposal(Path(f'test{i}.py'), Path(f'src/test{i}.py')) for i in range(3)]
+
+
+@pytest.fixture(scope="class")
+def conflict_tree(tmp_path_factory):
+    """Repository where test.py -> src/test.py conflicts, built once per class.
+    
+    Conflicting MOVEs fail validation before touching the disk, so tests
+    can share the tree.
+    """
+    root = tmp_path_factory.mktemp("conflict")
+    (root / 'src').mkdir()
+    (root / 'src' / 'test.py').write_bytes(b'existing')
+    (root / 'test.py').write_bytes(b't')
+    return root
+
+
+@pytest.fixture
+def executor(tmp_path):
+    """Dry-run executor over the per-test repository."""
+    return ProposalExecutor(tmp_path, dry_run=True)
+
+
+@pytest.fixture
+def executor_exec(tmp_path):
+    """Executor that really moves files in the per-test repository."""
+    return ProposalExecutor(tmp_path, dry_run=False)
+
+
 class TestExecutionResult:
     """Test ExecutionResult dataclass."""
     
@@ -16,7 +143,7 @@ class TestExecutionResult:
         """Test converting result to dictionary."""
         proposal = Proposal(
             action=ActionType.MOVE,
-            source_path=Path('test.py'),
+            source_path=TEST_PY,
             target_path=Path('tests/test.py'),
             reason="Test file",
             risk_level=RiskLevel.MEDIUM
@@ -42,219 +169,224 @@ class TestExecutionResult:
 class TestProposalExecutor:
     """Test ProposalExecutor functionality."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.test_file = self.temp_dir / 'test.py'
-        self.test_file.write_text('print("test")')
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-    
-    def test_executor_initialization(self):
+    def test_executor_initialization(self, tmp_path):
         """Test executor initializes correctly."""
-        executor = ProposalExecutor(self.temp_dir, dry_run=True)
+        executor = ProposalExecutor(tmp_path, dry_run=True)
         
-        assert executor.repo_path == self.temp_dir
+        assert executor.repo_path == tmp_path
         assert executor.dry_run is True
         assert len(executor.results) == 0
-        assert executor.log_file == self.temp_dir / '.repo-tool-history.json'
+        assert executor.log_file == tmp_path / '.repo-tool-history.json'
     
-    def test_dry_run_mode_no_filesystem_changes(self):
-        """Test dry-run mode doesn't modify filesystem."""
-        proposal = Proposal(
-            action=ActionType.MOVE,
-            source_path=Path('test.py'),
-            target_path=Path('src/test.py'),
-            reason="Test move",
-            risk_level=RiskLevel.LOW
-        )
-        
-        executor = ProposalExecutor(self.temp_dir, dry_run=True)
-        result = executor.execute_proposal(proposal)
+    @pytest.mark.parametrize('dry_run, target, message, expect_moved', [
+        (True, 'src/test.py', "[DRY-RUN] Would move", False),
+        (False, 'src/test.py', "Moved", True),
+        (False, 'deeply/nested/dir/test.py', "Moved", True),
+    ], ids=['dry-run', 'execute', 'creates-target-directory'])
+    def test_move(self, tmp_path, test_file, make_proposal, dry_run, target, message,
+                  expect_moved):
+        """Test a valid MOVE only touches the filesystem outside dry-run mode."""
+        proposal = make_proposal(target_path=Path(target))
+        target_full = tmp_path / proposal.target_path
+        
+        result = ProposalExecutor(tmp_path, dry_run=dry_run).execute_proposal(proposal)
         
         assert result.success is True
-        assert "[DRY-RUN]" in result.message
-        assert self.test_file.exists()  # Original file still exists
-        assert not (self.temp_dir / 'src' / 'test.py').exists()  # Target not created
+        assert result.message.startswith(message)
+        assert test_file.exists() is not expect_moved
+        assert target_full.exists() is expect_moved
+        # Dry-run does not create the target directory either
+        assert target_full.parent.exists() is expect_moved
     
-    def test_execute_mode_moves_file(self):
-        """Test execute mode actually moves files."""
-        proposal = Proposal(
-            action=ActionType.MOVE,
-            source_path=Path('test.py'),
-            target_path=Path('src/test.py'),
-            reason="Test move",
-            risk_level=RiskLevel.LOW
-        )
-        
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
-        result = executor.execute_proposal(proposal)
-        
-        assert result.success is True
-        assert "Moved" in result.message
-        assert not self.test_file.exists()  # Original file moved
-        assert (self.temp_dir / 'src' / 'test.py').exists()  # Target created
-    
-    def test_validation_source_not_exists(self):
-        """Test validation fails if source doesn't exist."""
-        proposal = Proposal(
-            action=ActionType.MOVE,
-            source_path=Path('nonexistent.py'),
-            target_path=Path('src/nonexistent.py'),
-            reason="Test move",
-            risk_level=RiskLevel.LOW
-        )
+    def test_dry_run_still_reports_conflicts(self, conflict_tree, make_proposal):
+        """Test dry-run returns only after validation, so conflicts are still reported."""
+        executor = ProposalExecutor(conflict_tree, dry_run=True)
         
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
-        result = executor.execute_proposal(proposal)
+        result = executor.execute_proposal(make_proposal())
         
         assert result.success is False
-        assert "does not exist" in result.message.lower()
+        assert "already exists" in result.message.lower()
     
-    def test_validation_target_already_exists(self):
-        """Test validation fails if target already exists (conflict)."""
-        # Create target file
-        target_dir = self.temp_dir / 'src'
-        target_dir.mkdir()
-        target_file = target_dir / 'test.py'
-        target_file.write_text('existing')
+    def test_move_ignores_working_directory(self, tmp_path, test_file, make_proposal,
+                                            executor_exec, monkeypatch):
+        """Test relative proposal paths resolve against repo_path, not the cwd."""
+        elsewhere = tmp_path / 'elsewhere'
+        elsewhere.mkdir()
+        monkeypatch.chdir(elsewhere)
         
-        proposal = Proposal(
-            action=ActionType.MOVE,
-            source_path=Path('test.py'),
-            target_path=Path('src/test.py'),
-            reason="Test move",
-            risk_level=RiskLevel.LOW
-        )
-        
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
-        result = executor.execute_proposal(proposal)
+        result = executor_exec.execute_proposal(make_proposal())
         
-        assert result.success is False
-        assert "already exists" in result.message.lower()
+        assert result.success is True
+        assert (tmp_path / 'src' / 'test.py').exists()
+        assert not (elsewhere / 'src').exists()
     
-    def test_creates_target_directory(self):
-        """Test executor creates target directory if needed."""
-        proposal = Proposal(
-            action=ActionType.MOVE,
-            source_path=Path('test.py'),
-            target_path=Path('deeply/nested/dir/test.py'),
-            reason="Test move",
-            risk_level=RiskLevel.LOW
-        )
+    def test_cross_device_move_falls_back_to_copy(self, tmp_path, test_file, make_proposal,
+                                                  executor_exec, monkeypatch):
+        """Test a rename failing with EXDEV still moves the file via shutil.move."""
+        def cross_device(source, target):
+            raise OSError(errno.EXDEV, 'Invalid cross-device link')
+        monkeypatch.setattr(executor_module.os, 'replace', cross_device)
         
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
-        result = executor.execute_proposal(proposal)
+        result = executor_exec.execute_proposal(make_proposal())
         
         assert result.success is True
-        assert (self.temp_dir / 'deeply' / 'nested' / 'dir' / 'test.py').exists()
+        assert not test_file.exists()
+        assert (tmp_path / 'src' / 'test.py').read_bytes() == b'print("test")'
     
-    def test_unsupported_action_type(self):
+    def test_unsupported_action_type(self, make_proposal, executor_exec):
         """Test that non-MOVE actions are rejected."""
-        proposal = Proposal(
-            action=ActionType.FLAG,
-            source_path=Path('test.py'),
-            target_path=None,
-            reason="Test flag",
-            risk_level=RiskLevel.HIGH
-        )
+        proposal = make_proposal(target_path=None, action=ActionType.FLAG,
+                                 reason="Test flag", risk_level=RiskLevel.HIGH)
         
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
-        result = executor.execute_proposal(proposal)
+        result = executor_exec.execute_proposal(proposal)
         
         assert result.success is False
         assert result.skipped is True
         assert "Unsupported action" in result.message
     
-    def test_save_history(self):
+    def test_save_history(self, tmp_path, test_file, make_proposal, executor_exec):
         """Test execution history is saved correctly."""
-        proposal = Proposal(
-            action=ActionType.MOVE,
-            source_path=Path('test.py'),
-            target_path=Path('src/test.py'),
-            reason="Test move",
-            risk_level=RiskLevel.LOW
-        )
+        proposal = make_proposal()
         
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
-        executor.execute_proposal(proposal)
-        executor.save_history()
+        executor_exec.execute_proposal(proposal)
+        executor_exec.save_history()
         
-        log_file = self.temp_dir / '.repo-tool-history.json'
+        log_file = tmp_path / '.repo-tool-history.json'
         assert log_file.exists()
         
-        with open(log_file) as f:
-            history = json.load(f)
+        history = load_history(log_file)
         
         assert len(history) == 1
         assert history[0]['action'] == 'move'
         assert history[0]['source'] == 'test.py'
         assert history[0]['success'] is True
     
-    def test_get_summary(self):
-        """Test execution summary calculation."""
-        proposals = [
-            Proposal(ActionType.MOVE, Path('file1.py'), Path('src/file1.py'), "Move", RiskLevel.LOW),
-            Proposal(ActionType.MOVE, Path('file2.py'), Path('src/file2.py'), "Move", RiskLevel.LOW),
-            Proposal(ActionType.FLAG, Path('file3.py'), None, "Flag", RiskLevel.HIGH),  # Will be skipped
-        ]
+    def test_save_history_without_orjson(self, tmp_path, test_file, make_proposal,
+                                         executor_exec, monkeypatch):
+        """Test the stdlib json fallback writes the same readable history."""
+        monkeypatch.setattr(executor_module, 'orjson', None)
         
-        # Create test files
-        (self.temp_dir / 'file1.py').write_text('test')
-        (self.temp_dir / 'file2.py').write_text('test')
+        executor_exec.execute_proposal(make_proposal())
+        executor_exec.save_history()
         
-        executor = ProposalExecutor(self.temp_dir, dry_run=True)
-        
-        for proposal in proposals:
-            executor.execute_proposal(proposal)
+        history = load_history(tmp_path / '.repo-tool-history.json')
+        assert [entry['source'] for entry in history] == ['test.py']
+    
+    def test_history_reread_only_when_file_changes(self, tmp_path, test_file, make_proposal,
+                                                   executor_exec, monkeypatch):
+        """Test saved history is reused until the log file changes on disk."""
+        loads = []
+        original = executor_module._load_history_bytes
+        monkeypatch.setattr(executor_module, '_load_history_bytes',
+                            lambda data: loads.append(data) or original(data))
+        
+        for name in ('test2.py', 'test3.py'):
+            (tmp_path / name).write_bytes(b'test')
+        
+        executor_exec.execute_proposal(make_proposal())
+        executor_exec.save_history()
+        executor_exec.execute_proposal(make_proposal(Path('test2.py'), Path('src/test2.py')))
+        executor_exec.save_history()
+        assert loads == []  # Second save appended to the cached copy
+        
+        log_file = tmp_path / '.repo-tool-history.json'
+        log_file.write_bytes(b'[]')
+        executor_exec.execute_proposal(make_proposal(Path('test3.py'), Path('src/test3.py')))
+        executor_exec.save_history()
+        assert len(loads) == 1  # External rewrite was picked up
+        assert len(load_history(log_file)) == 1
+    
+    def test_save_history_skips_already_logged_results(self, tmp_path, test_file,
+                                                       make_proposal, executor_exec):
+        """Test a save after execute_batch does not log the batch a second time."""
+        executor_exec.execute_batch([make_proposal()])
+        executor_exec.save_history()
+        executor_exec.save_history()
+        
+        assert len(load_history(tmp_path / '.repo-tool-history.json')) == 1
+    
+    @pytest.mark.parametrize('fields, counts', list(zip(SUMMARY_PROPOSAL_FIELDS, [
+        {'successful': 1, 'failed': 0, 'skipped': 0},
+        {'successful': 1, 'failed': 0, 'skipped': 0},
+        {'successful': 0, 'failed': 0, 'skipped': 1},  # FLAG is skipped
+    ])), ids=['move-file1', 'move-file2', 'flag-skipped'])
+    def test_get_summary(self, tmp_path, executor, make_proposal, fields, counts):
+        """Test the summary counts each kind of proposal contributes."""
+        proposal = make_proposal(**fields)
+        (tmp_path / proposal.source_path).write_bytes(b'test')
+        
+        executor.execute_batch([proposal])
         
         summary = executor.get_summary()
         
-        assert summary['total'] == 3
-        assert summary['successful'] == 2  # 2 MOVEs succeeded
-        assert summary['skipped'] == 1  # FLAG was skipped
-        assert summary['failed'] == 0
+        assert summary['total'] == 1
+        assert {key: summary[key] for key in counts} == counts
         assert summary['dry_run'] is True
     
-    def test_multiple_executions_append_history(self):
+    def test_execute_batch_saves_history_once(self, tmp_path, executor_exec, summary_proposals,
+                                              monkeypatch):
+        """Test a real batch is logged with a single history write."""
+        for proposal in summary_proposals[:2]:
+            (tmp_path / proposal.source_path).write_bytes(b'test')
+        writes = []
+        original = executor_exec._write_history
+        
+        def recording_write_history(history):
+            writes.append(len(history))
+            original(history)
+        
+        monkeypatch.setattr(executor_exec, '_write_history', recording_write_history)
+        
+        results = executor_exec.execute_batch(summary_proposals)
+        
+        assert [r.proposal for r in results] == summary_proposals
+        assert writes == [3]
+        assert (tmp_path / 'src' / 'file2.py').exists()
+        summary = executor_exec.get_summary()
+        assert (summary['total'], summary['successful'], summary['skipped']) == (3, 2, 1)
+    
+    def test_execute_batch_creates_shared_parent_once(self, tmp_path, executor_exec,
+                                                      move_batch, monkeypatch):
+        """Test moves into the same directory ensure it only once per batch."""
+        for proposal in move_batch:
+            (tmp_path / proposal.source_path).write_bytes(b'test')
+        ensured = []
+        original = executor_module._ensure_dir
+        
+        def recording_ensure_dir(directory):
+            ensured.append(directory)
+            original(directory)
+        
+        monkeypatch.setattr(executor_module, '_ensure_dir', recording_ensure_dir)
+        
+        results = executor_exec.execute_batch(move_batch)
+        
+        assert all(r.success for r in results)
+        assert ensured == [str(tmp_path / 'src')]
+    
+    def test_multiple_executions_append_history(self, tmp_path, test_file, make_proposal):
         """Test that multiple executions append to history."""
-        proposal1 = Proposal(
-            action=ActionType.MOVE,
-            source_path=Path('test.py'),
-            target_path=Path('src/test.py'),
-            reason="First move",
-            risk_level=RiskLevel.LOW
-        )
+        proposal1 = make_proposal(reason="First move")
         
         # First execution
-        executor1 = ProposalExecutor(self.temp_dir, dry_run=False)
+        executor1 = ProposalExecutor(tmp_path, dry_run=False)
         executor1.execute_proposal(proposal1)
         executor1.save_history()
         
         # Create another test file
-        test_file2 = self.temp_dir / 'test2.py'
-        test_file2.write_text('test2')
+        test_file2 = tmp_path / 'test2.py'
+        test_file2.write_bytes(b'test2')
         
-        proposal2 = Proposal(
-            action=ActionType.MOVE,
-            source_path=Path('test2.py'),
-            target_path=Path('src/test2.py'),
-            reason="Second move",
-            risk_level=RiskLevel.LOW
-        )
+        proposal2 = make_proposal(Path('test2.py'), Path('src/test2.py'), reason="Second move")
         
         # Second execution
-        executor2 = ProposalExecutor(self.temp_dir, dry_run=False)
+        executor2 = ProposalExecutor(tmp_path, dry_run=False)
         executor2.execute_proposal(proposal2)
         executor2.save_history()
         
         # Check history
-        log_file = self.temp_dir / '.repo-tool-history.json'
-        with open(log_file) as f:
-            history = json.load(f)
+        log_file = tmp_path / '.repo-tool-history.json'
+        history = load_history(log_file)
         
         assert len(history) == 2
         assert history[0]['source'] == 'test.py'
@@ -264,88 +396,79 @@ class TestProposalExecutor:
 class TestExecutorEdgeCases:
     """Test edge cases and error handling."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-    
-    def test_source_path_none(self):
-        """Test validation fails gracefully with None source path."""
-        proposal = Proposal(
-            action=ActionType.MOVE,
-            source_path=None,
-            target_path=Path('target.py'),
-            reason="Test",
-            risk_level=RiskLevel.LOW
-        )
-        
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
-        result = executor.execute_proposal(proposal)
+    @pytest.mark.parametrize('proposal_kwargs, existing, expected', [
+        ({'source_path': Path('nonexistent.py'), 'target_path': Path('src/nonexistent.py')},
+         (), "does not exist"),
+        ({'source_path': Path('pkg')}, ('pkg/',), "source is not a file"),
+        ({'target_path': Path('blocker/test.py')}, ('test.py', 'blocker'), "not a directory"),
+    ], ids=['source-missing', 'source-directory', 'parent-is-file'])
+    def test_validation_failures(self, tmp_path, make_proposal, executor_exec,
+                                 proposal_kwargs, existing, expected):
+        """Test invalid MOVEs fail validation gracefully without moving anything."""
+        # Entries ending in '/' are directories, everything else a file
+        for name in existing:
+            path = tmp_path / name
+            if name.endswith('/'):
+                path.mkdir(parents=True)
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b'existing')
+        
+        result = executor_exec.execute_proposal(make_proposal(**proposal_kwargs))
         
         assert result.success is False
-        assert "Source path is None" in result.message
+        assert result.skipped is False
+        assert expected in result.message.lower()
     
-    def test_target_path_none(self):
-        """Test validation fails gracefully with None target path."""
-        test_file = self.temp_dir / 'test.py'
-        test_file.write_text('test')
+    @pytest.mark.parametrize('proposal_kwargs, expected', [
+        ({'source_path': None, 'target_path': Path('target.py')}, "source path is none"),
+        ({'target_path': None}, "target path is none"),
+    ], ids=['source-none', 'target-none'])
+    def test_missing_paths(self, make_proposal, executor_exec, proposal_kwargs, expected):
+        """Test MOVEs without a source or target are rejected before any disk access."""
+        result = executor_exec.execute_proposal(make_proposal(**proposal_kwargs))
         
-        proposal = Proposal(
-            action=ActionType.MOVE,
-            source_path=Path('test.py'),
-            target_path=None,
-            reason="Test",
-            risk_level=RiskLevel.LOW
-        )
+        assert result.success is False
+        assert result.skipped is False
+        assert expected in result.message.lower()
+        assert executor_exec.get_summary()['failed'] == 1
+    
+    @pytest.mark.parametrize('dry_run', [True, False], ids=['dry-run', 'execute'])
+    def test_target_conflict(self, conflict_tree, make_proposal, dry_run):
+        """Test a MOVE onto an existing file fails and leaves both files alone."""
+        executor = ProposalExecutor(conflict_tree, dry_run=dry_run)
         
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
-        result = executor.execute_proposal(proposal)
+        result = executor.execute_proposal(make_proposal())
         
         assert result.success is False
-        assert "Target path is None" in result.message
+        assert "already exists" in result.message.lower()
+        assert (conflict_tree / 'test.py').read_bytes() == b't'
+        assert (conflict_tree / 'src' / 'test.py').read_bytes() == b'existing'
 
 
 class TestRollback:
     """Test rollback (undo) functionality (V2.2)."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-    
-    def test_rollback_dry_run_no_changes(self):
+    def test_rollback_dry_run_no_changes(self, tmp_path, make_proposal):
         """Test rollback dry-run makes no filesystem changes."""
         # Create initial file and execute move
-        test_file = self.temp_dir / 'test.py'
-        test_file.write_text('test')
+        test_file = tmp_path / 'test.py'
+        test_file.write_bytes(b'test')
         
-        proposal = Proposal(
-            action=ActionType.MOVE,
-            source_path=Path('test.py'),
-            target_path=Path('src/test.py'),
-            reason="Test move",
-            risk_level=RiskLevel.LOW
-        )
+        proposal = make_proposal()
         
         # Execute move
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
+        executor = ProposalExecutor(tmp_path, dry_run=False)
         executor.execute_proposal(proposal)
         executor.save_history()
         
         # Verify move happened
+        target = tmp_path.joinpath('src', 'test.py')
         assert not test_file.exists()
-        assert (self.temp_dir / 'src' / 'test.py').exists()
+        assert target.exists()
         
         # Rollback in dry-run mode
-        rollback_executor = ProposalExecutor(self.temp_dir, dry_run=True)
+        rollback_executor = ProposalExecutor(tmp_path, dry_run=True)
         results = rollback_executor.rollback_moves(count=1)
         
         # Verify dry-run didn't change filesystem
@@ -353,35 +476,29 @@ class TestRollback:
         assert results[0].success is True
         assert "DRY-RUN" in results[0].message
         assert not test_file.exists()  # Still doesn't exist
-        assert (self.temp_dir / 'src' / 'test.py').exists()  # Still exists
+        assert target.exists()  # Still exists
     
-    def test_rollback_execute_restores_files(self):
+    def test_rollback_execute_restores_files(self, tmp_path, make_proposal):
         """Test rollback execution actually restores files to original location."""
         # Create initial file and execute move
-        test_file = self.temp_dir / 'test.py'
-        test_file.write_text('test content')
+        test_file = tmp_path / 'test.py'
+        test_file.write_bytes(b'test content')
         
-        proposal = Proposal(
-            action=ActionType.MOVE,
-            source_path=Path('test.py'),
-            target_path=Path('src/test.py'),
-            reason="Test move",
-            risk_level=RiskLevel.LOW
-        )
+        proposal = make_proposal()
         
         # Execute move
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
+        executor = ProposalExecutor(tmp_path, dry_run=False)
         executor.execute_proposal(proposal)
         executor.save_history()
         
         # Verify move happened
         assert not test_file.exists()
-        target = self.temp_dir / 'src' / 'test.py'
+        target = tmp_path.joinpath('src', 'test.py')
         assert target.exists()
-        assert target.read_text() == 'test content'
+        assert target.read_bytes() == b'test content'
         
         # Rollback in execute mode
-        rollback_executor = ProposalExecutor(self.temp_dir, dry_run=False)
+        rollback_executor = ProposalExecutor(tmp_path, dry_run=False)
         results = rollback_executor.rollback_moves(count=1)
         
         # Verify rollback succeeded
@@ -391,37 +508,37 @@ class TestRollback:
         
         # Verify file restored to original location
         assert test_file.exists()
-        assert test_file.read_text() == 'test content'
+        assert test_file.read_bytes() == b'test content'
         assert not target.exists()
     
-    def test_rollback_multiple_operations_lifo(self):
+    def test_rollback_ignores_cached_history(self, tmp_path, test_file, make_proposal,
+                                             executor_exec):
+        """Test rollback re-reads a log rewritten in place with the same size and mtime."""
+        executor_exec.execute_proposal(make_proposal())
+        executor_exec.save_history()
+        
+        # Empty the log without changing its inode, size or mtime
+        log_file = tmp_path / '.repo-tool-history.json'
+        st = log_file.stat()
+        log_file.write_bytes(b'[]'.ljust(st.st_size))
+        os.utime(log_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        assert executor_exec.rollback_moves(count=1) == []
+        assert (tmp_path / 'src' / 'test.py').exists()
+    
+    def test_rollback_multiple_operations_lifo(self, tmp_path, move_batch):
         """Test rollback handles multiple operations in LIFO order."""
         # Create and move multiple files
-        files = []
-        for i in range(3):
-            test_file = self.temp_dir / f'test{i}.py'
-            test_file.write_text(f'test {i}')
-            files.append(test_file)
-        
-        # Execute moves
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
-        for i, test_file in enumerate(files):
-            proposal = Proposal(
-                action=ActionType.MOVE,
-                source_path=Path(f'test{i}.py'),
-                target_path=Path(f'src/test{i}.py'),
-                reason="Test move",
-                risk_level=RiskLevel.LOW
-            )
-            executor.execute_proposal(proposal)
-        executor.save_history()
+        for i, proposal in enumerate(move_batch):
+            (tmp_path / proposal.source_path).write_bytes(f'test {i}'.encode())
+        ProposalExecutor(tmp_path, dry_run=False).execute_batch(move_batch)
         
         # Verify all moved
-        for test_file in files:
-            assert not test_file.exists()
+        for proposal in move_batch:
+            assert not (tmp_path / proposal.source_path).exists()
         
         # Rollback last 2 operations
-        rollback_executor = ProposalExecutor(self.temp_dir, dry_run=False)
+        rollback_executor = ProposalExecutor(tmp_path, dry_run=False)
         results = rollback_executor.rollback_moves(count=2)
         
         # Verify 2 rollbacks succeeded
@@ -429,92 +546,65 @@ class TestRollback:
         assert all(r.success for r in results)
         
         # Verify test2.py and test1.py restored (LIFO order)
-        assert (self.temp_dir / 'test2.py').exists()
-        assert (self.temp_dir / 'test1.py').exists()
-        assert not (self.temp_dir / 'test0.py').exists()  # Not rolled back
+        assert (tmp_path / 'test2.py').exists()
+        assert (tmp_path / 'test1.py').exists()
+        assert not (tmp_path / 'test0.py').exists()  # Not rolled back
     
-    def test_rollback_validation_target_not_exists(self):
+    def test_rollback_validation_target_not_exists(self, tmp_path):
         """Test rollback fails if target file doesn't exist."""
-        # Create history manually with fake entry
-        history = [{
-            'timestamp': '2025-12-19T12:00:00',
-            'action': 'MOVE',
-            'source': 'test.py',
-            'target': 'src/test.py',
-            'success': True,
-            'skipped': False,
-            'risk': 'low',
-            'message': 'Moved'
-        }]
-        
-        history_file = self.temp_dir / '.repo-tool-history.json'
-        with open(history_file, 'w') as f:
-            json.dump(history, f)
+        (tmp_path / '.repo-tool-history.json').write_bytes(FAKE_HISTORY_SINGLE)
         
         # Target doesn't exist (file was never actually moved)
         # Rollback should fail validation
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
+        executor = ProposalExecutor(tmp_path, dry_run=False)
         results = executor.rollback_moves(count=1)
         
         assert len(results) == 1
         assert results[0].success is False
         assert "Target file does not exist" in results[0].message
     
-    def test_rollback_validation_source_already_exists(self):
+    def test_rollback_validation_source_already_exists(self, tmp_path, make_proposal):
         """Test rollback fails if source location already has a file (conflict)."""
         # Create initial file and move it
-        test_file = self.temp_dir / 'test.py'
-        test_file.write_text('original')
+        test_file = tmp_path / 'test.py'
+        test_file.write_bytes(b'original')
         
-        proposal = Proposal(
-            action=ActionType.MOVE,
-            source_path=Path('test.py'),
-            target_path=Path('src/test.py'),
-            reason="Test move",
-            risk_level=RiskLevel.LOW
-        )
+        proposal = make_proposal()
         
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
+        executor = ProposalExecutor(tmp_path, dry_run=False)
         executor.execute_proposal(proposal)
         executor.save_history()
         
         # Create a conflicting file at original location
-        test_file.write_text('conflict')
+        test_file.write_bytes(b'conflict')
         
         # Rollback should fail due to conflict
-        rollback_executor = ProposalExecutor(self.temp_dir, dry_run=False)
+        rollback_executor = ProposalExecutor(tmp_path, dry_run=False)
         results = rollback_executor.rollback_moves(count=1)
         
         assert len(results) == 1
         assert results[0].success is False
         assert "already exists (conflict)" in results[0].message
     
-    def test_rollback_logs_to_history(self):
+    def test_rollback_logs_to_history(self, tmp_path, make_proposal):
         """Test rollback operations are logged to history."""
         # Create and move file
-        test_file = self.temp_dir / 'test.py'
-        test_file.write_text('test')
+        test_file = tmp_path / 'test.py'
+        test_file.write_bytes(b'test')
         
-        proposal = Proposal(
-            action=ActionType.MOVE,
-            source_path=Path('test.py'),
-            target_path=Path('src/test.py'),
-            reason="Test move",
-            risk_level=RiskLevel.LOW
-        )
+        proposal = make_proposal()
         
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
+        executor = ProposalExecutor(tmp_path, dry_run=False)
         executor.execute_proposal(proposal)
         executor.save_history()
         
         # Rollback
-        rollback_executor = ProposalExecutor(self.temp_dir, dry_run=False)
+        rollback_executor = ProposalExecutor(tmp_path, dry_run=False)
         rollback_executor.rollback_moves(count=1)
         
         # Check history
-        history_file = self.temp_dir / '.repo-tool-history.json'
-        with open(history_file, 'r') as f:
-            history = json.load(f)
+        history_file = tmp_path / '.repo-tool-history.json'
+        history = load_history(history_file)
         
         # Should have 2 entries: original MOVE and ROLLBACK
         assert len(history) == 2
@@ -522,63 +612,27 @@ class TestRollback:
         assert history[1]['action'].upper() == 'ROLLBACK'
         assert history[1]['success'] is True
     
-    def test_rollback_no_history_file(self):
+    def test_rollback_no_history_file(self, tmp_path):
         """Test rollback handles missing history file gracefully."""
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
+        executor = ProposalExecutor(tmp_path, dry_run=False)
         results = executor.rollback_moves(count=1)
         
         assert len(results) == 0
     
-    def test_rollback_only_undoes_successful_moves(self):
+    def test_rollback_only_undoes_successful_moves(self, tmp_path):
         """Test rollback only processes successful MOVE operations."""
-        # Create history with mixed entries
-        history = [
-            {
-                'timestamp': '2025-12-19T12:00:00',
-                'action': 'MOVE',
-                'source': 'test1.py',
-                'target': 'src/test1.py',
-                'success': True,
-                'skipped': False,
-                'risk': 'low',
-                'message': 'Moved'
-            },
-            {
-                'timestamp': '2025-12-19T12:01:00',
-                'action': 'MOVE',
-                'source': 'test2.py',
-                'target': 'src/test2.py',
-                'success': False,  # Failed move
-                'skipped': False,
-                'risk': 'low',
-                'message': 'Failed'
-            },
-            {
-                'timestamp': '2025-12-19T12:02:00',
-                'action': 'FLAG',  # Non-MOVE action
-                'source': 'test3.py',
-                'target': None,
-                'success': True,
-                'skipped': False,
-                'risk': 'low',
-                'message': 'Flagged'
-            }
-        ]
-        
         # Create only the successfully moved file
-        moved_file = self.temp_dir / 'src' / 'test1.py'
+        moved_file = tmp_path.joinpath('src', 'test1.py')
         moved_file.parent.mkdir(parents=True)
-        moved_file.write_text('test1')
+        moved_file.write_bytes(b'test1')
         
-        history_file = self.temp_dir / '.repo-tool-history.json'
-        with open(history_file, 'w') as f:
-            json.dump(history, f)
+        (tmp_path / '.repo-tool-history.json').write_bytes(FAKE_HISTORY_MIXED)
         
         # Rollback should only process the successful MOVE
-        executor = ProposalExecutor(self.temp_dir, dry_run=False)
+        executor = ProposalExecutor(tmp_path, dry_run=False)
         results = executor.rollback_moves(count=10)  # Request more than available
         
         # Should only rollback the one successful MOVE
         assert len(results) == 1
-        assert (self.temp_dir / 'test1.py').exists()
+        assert (tmp_path / 'test1.py').exists()
 
@@ -352,3 +352,14 @@ class TestImportAnalyzerEdgeCases:
         assert imports[0].is_relative
         assert imports[0].level == 3
         assert imports[0].module == "utils"
+    
+    def test_extract_imports_from_bytes(self, temp_python_repo):
+        """Test extracting imports from pre-read source bytes."""
+        analyzer = ImportAnalyzer(temp_python_repo)
+        
+        imports = analyzer.extract_imports_from_bytes(
+            Path("inline.py"), b"import os\nfrom .utils import helper\n"
+        )
+        
+        assert [i.module for i in imports] == ["os", "utils"]
+        assert imports[1].is_relative
@@ -1,26 +1,28 @@
 """Tests for the structure reasoner."""
 import pytest
 from pathlib import Path
-import tempfile
 
 from src.analyzer import FileMetadata, RepositoryAnalyzer
-from src.reasoner import StructureReasoner
+from src.classifier import FileCategory
+from src.reasoner import ClassifiedFile, StructureReasoner
 from src.proposal import ActionType, RiskLevel
 from src.repo_type import RepoType
+from tests.conftest import make_file
 
 
 class TestStructureReasoner:
     """Test suite for StructureReasoner."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self, tmp_path):
         """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = tmp_path
     
     def create_metadata(self, filename: str, **kwargs) -> FileMetadata:
         """Helper to create FileMetadata for testing."""
         file_path = self.temp_dir / filename
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
+        make_file(file_path)
         
         metadata = FileMetadata(file_path, self.temp_dir)
         
@@ -83,7 +85,7 @@ class TestStructureReasoner:
         # Create file in correct location
         file_path = self.temp_dir / 'src' / 'app.py'
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
+        make_file(file_path)
         
         metadata = FileMetadata(file_path, self.temp_dir)
         metadata.imports = ['fastapi']
@@ -114,6 +116,23 @@ class TestStructureReasoner:
         high_risk = generator.get_by_risk(RiskLevel.HIGH)
         assert len(high_risk) > 0
     
+    @pytest.mark.parametrize('filename, wording', [
+        ('.env', 'environment variables'),
+        ('prod.env', 'environment variables'),
+        ('.env.example', 'environment variables'),
+        ('Pipfile.lock', 'Python dependencies'),
+        ('requirements.txt', 'Python dependencies'),
+        ('pyproject.toml', 'Python project metadata'),
+        ('app.yml', 'YAML configuration'),
+    ])
+    def test_config_reason_wording(self, filename, wording):
+        """Test config reasons name the kind of configuration file."""
+        entry = ClassifiedFile(self.create_metadata(filename), FileCategory.CONFIGS)
+        
+        reason = StructureReasoner(self.temp_dir)._generate_reason(entry)
+        
+        assert f"Configuration file: {wording}" in reason
+    
     def test_duplicate_detection(self):
         """Test duplicate file detection."""
         # Create duplicate files
@@ -121,7 +140,7 @@ class TestStructureReasoner:
         
         duplicate_path = self.temp_dir / 'backup' / 'app.py'
         duplicate_path.parent.mkdir(parents=True, exist_ok=True)
-        duplicate_path.touch()
+        make_file(duplicate_path)
         metadata2 = FileMetadata(duplicate_path, self.temp_dir)
         
         reasoner = StructureReasoner(self.temp_dir)
@@ -139,15 +158,16 @@ class TestStructureReasoner:
 class TestRepoTypeGating:
     """Test that MOVE proposals are gated by repository type."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self, tmp_path):
         """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = tmp_path
     
     def create_metadata(self, filename: str, **kwargs) -> FileMetadata:
         """Helper to create FileMetadata for testing."""
         file_path = self.temp_dir / filename
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
+        make_file(file_path)
         
         metadata = FileMetadata(file_path, self.temp_dir)
         
@@ -254,15 +274,16 @@ class TestRepoTypeGating:
 class TestStructuralFileExemptions:
     """Test that structural Python files are exempt from duplicate detection."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self, tmp_path):
         """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = tmp_path
     
     def create_metadata(self, filename: str, **kwargs) -> FileMetadata:
         """Helper to create FileMetadata for testing."""
         file_path = self.temp_dir / filename
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
+        make_file(file_path)
         
         metadata = FileMetadata(file_path, self.temp_dir)
         
@@ -345,15 +366,16 @@ class TestStructuralFileExemptions:
 class TestDuplicateRiskStratification:
     """Test risk stratification for duplicate file detection."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self, tmp_path):
         """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = tmp_path
     
     def create_metadata(self, path: str):
         """Helper to create FileMetadata."""
         file_path = self.temp_dir / path
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
+        make_file(file_path)
         
         metadata = FileMetadata(file_path, self.temp_dir)
         return metadata
@@ -474,15 +496,16 @@ class TestDuplicateRiskStratification:
 class TestMoveGatingEnforcement:
     """Test that MOVE proposals are absolutely prevented in non-Python repos."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self, tmp_path):
         """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = tmp_path
     
     def create_metadata(self, filename: str, **kwargs) -> FileMetadata:
         """Helper to create FileMetadata for testing."""
         file_path = self.temp_dir / filename
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
+        make_file(file_path)
         
         metadata = FileMetadata(file_path, self.temp_dir)
         
@@ -542,15 +565,16 @@ class TestMoveGatingEnforcement:
 class TestFlagSuppression:
     """Test FLAG proposal suppression when MOVE exists."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self, tmp_path):
         """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = tmp_path
     
     def create_metadata(self, path: str, imports=None, has_tests=False):
         """Helper to create FileMetadata."""
         file_path = self.temp_dir / path
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
+        make_file(file_path)
         
         metadata = FileMetadata(file_path, self.temp_dir)
         metadata.imports = imports or []
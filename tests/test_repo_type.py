@@ -1,25 +1,26 @@
 """Tests for repository type detection."""
 import pytest
 from pathlib import Path
-import tempfile
 
 from src.analyzer import FileMetadata
 from src.repo_type import RepoTypeDetector, RepoType
+from tests.conftest import make_file
 
 
 class TestRepoTypeDetector:
     """Test suite for RepoTypeDetector."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self, tmp_path):
         """Set up test fixtures."""
         self.detector = RepoTypeDetector()
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = tmp_path
     
     def create_metadata(self, filename: str, **kwargs) -> FileMetadata:
         """Helper to create FileMetadata for testing."""
         file_path = self.temp_dir / filename
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
+        make_file(file_path)
         
         metadata = FileMetadata(file_path, self.temp_dir)
         
@@ -165,16 +166,17 @@ class TestRepoTypeDetector:
 class TestRepoTypeScoring:
     """Test scoring logic."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self, tmp_path):
         """Set up test fixtures."""
         self.detector = RepoTypeDetector()
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = tmp_path
     
     def create_metadata(self, filename: str) -> FileMetadata:
         """Helper to create FileMetadata for testing."""
         file_path = self.temp_dir / filename
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch()
+        make_file(file_path)
         return FileMetadata(file_path, self.temp_dir)
     
     def test_python_score_with_many_py_files(self):
@@ -46,6 +46,17 @@ class TestTreeNode:
         assert "test.py" in rendered
         assert "app.py" in rendered
     
+    def test_render_after_adding_path(self):
+        """Test that rendering picks up paths added after a previous render."""
+        root = TreeNode(".")
+        root.add_path(Path("b.py"))
+        root.render()
+        
+        root.add_path(Path("a.py"))
+        lines = root.render()
+        
+        assert lines == ["├── a.py", "└── b.py"]
+    
     def test_render_nested_tree(self):
         """Test rendering a nested tree."""
         root = TreeNode(".")
@@ -157,6 +168,29 @@ class TestTreeDiffVisualizer:
         assert Path("test.py") not in after_state
         assert Path("app.py") not in after_state
     
+    def test_tree_diff_truncation(self):
+        """Test that only the first max_files paths are shown when truncating."""
+        proposals = [
+            Proposal(
+                action=ActionType.MOVE,
+                source_path=Path(f"mod_{i}.py"),
+                target_path=Path(f"src/mod_{i}.py"),
+                reason="Source",
+                risk_level=RiskLevel.LOW
+            )
+            for i in range(5)
+        ]
+        
+        visualizer = TreeDiffVisualizer(proposals, [])
+        diff = visualizer.generate_tree_diff(max_files=2)
+        
+        assert "mod_0.py" in diff['before']
+        assert "mod_1.py" in diff['before']
+        assert "mod_4.py" not in diff['before']
+        assert "mod_1.py" in diff['after']
+        assert "mod_2.py" not in diff['after']
+        assert "showing 2 of 5 affected files" in diff['before']
+    
     def test_generate_impact_summary(self):
         """Test generating impact summary."""
         move1 = Proposal(
@@ -219,6 +253,22 @@ class TestTreeDiffVisualizer:
         assert summary['duplicate_groups'] == 1
         assert len(summary['new_directories']) == 0
     
+    def test_impact_summary_cached(self):
+        """Test that the impact summary is computed once and reused."""
+        move = Proposal(
+            action=ActionType.MOVE,
+            source_path=Path("app.py"),
+            target_path=Path("src/app.py"),
+            reason="Source",
+            risk_level=RiskLevel.LOW
+        )
+        
+        visualizer = TreeDiffVisualizer([move], [])
+        summary = visualizer.generate_impact_summary()
+        
+        assert visualizer.generate_impact_summary() is summary
+        assert "Files to be moved:     1" in visualizer.render_impact_summary()
+    
     def test_render_impact_summary(self):
         """Test rendering impact summary as text."""
         move = Proposal(
@@ -283,6 +333,16 @@ class TestTreeDiffVisualizer:
         assert "test.py" in rendered
         assert "tests/" in rendered
     
+    def test_render_tree_diff_no_affected_files(self):
+        """Test that an empty proposal list renders a compact no-changes block."""
+        visualizer = TreeDiffVisualizer([], [Path("app.py")])
+        
+        assert visualizer.generate_tree_diff() == {'before': ".", 'after': "."}
+        
+        rendered = visualizer.render_tree_diff()
+        assert "No structural changes proposed." in rendered
+        assert "BEFORE (current):" not in rendered
+    
     def test_affected_files_includes_flags(self):
         """Test that affected files include both moves and flags."""
         move = Proposal(
@@ -305,12 +365,35 @@ class TestTreeDiffVisualizer:
         current_files = [Path("app.py"), Path("config.py")]
         
         visualizer = TreeDiffVisualizer(proposals, current_files)
-        affected = visualizer._get_affected_files()
+        affected = visualizer._get_affected_set()
         
         assert Path("app.py") in affected
         assert Path("config.py") in affected
         assert len(affected) == 2
     
+    def test_affected_files_cached(self):
+        """Test that affected files are computed once and reused."""
+        move = Proposal(
+            action=ActionType.MOVE,
+            source_path=Path("b.py"),
+            target_path=Path("src/b.py"),
+            reason="Source",
+            risk_level=RiskLevel.LOW
+        )
+        flag = Proposal(
+            action=ActionType.FLAG,
+            source_path=Path("a.py"),
+            target_path=None,
+            reason="Review",
+            risk_level=RiskLevel.LOW
+        )
+        
+        visualizer = TreeDiffVisualizer([move, flag], [])
+        first = visualizer._get_affected_set()
+        
+        assert first == {Path("a.py"), Path("b.py")}
+        assert visualizer._get_affected_set() is first
+    
     def test_new_directories_extraction(self):
         """Test extraction of new directories from proposals."""
         move1 = Proposal(